@@ -55,22 +55,15 @@ fx.seed_lme(metal="COPPER")
 #
 #
 # # -------------------------------------------------------------
-# # 2. Latest RBI-only forex rates
+# # 2. Latest RBI and SBI forex rates in a single query
 # # -------------------------------------------------------------
-# # Only retrieves the latest RBI reference rate available in DB.
-# rates = fx.rate(source_filter="rbi")
+# # Pass one source ("rbi" / "sbi") or several at once. Both sources are
+# # fetched in one round-trip and returned SBI first, then RBI.
+# # SBI sometimes publishes only a subset of currencies, which is useful if
+# # your workflow depends on forex card or remittance rates.
+# rates = fx.rate(source_filter=("rbi", "sbi"))
 # for rate in rates:
-#     print(rate.get("rates"))
-#
-#
-# # -------------------------------------------------------------
-# # 3. Latest SBI-only forex rates
-# # -------------------------------------------------------------
-# # SBI sometimes publishes only a subset of currencies.
-# # Useful if your workflow depends on forex card or remittance rates.
-# rates = fx.rate(source_filter="sbi")
-# for rate in rates:
-#     print(rate.get("rates"))
+#     print(rate.get("source"), rate.get("rates"))
 #
 # TIP: "weekly" and "monthly" are perfect for charts and analytics.
 # history = fx.history(
@@ -2,39 +2,48 @@
 
 from __future__ import annotations
 
+import importlib
 import re
+import threading
+import time
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, timedelta
 from enum import Enum
+from functools import partial, wraps
 from importlib import metadata as importlib_metadata
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, cast
-from urllib.parse import parse_qsl, quote, urlencode, urlparse, urlunparse
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    TypeVar,
+    cast,
+)
+from urllib.parse import SplitResult, quote, unquote_plus, urlsplit, urlunsplit
 
 from fx_bharat.db import DEFAULT_SQLITE_DB_PATH
 from fx_bharat.db.base_backend import BackendStrategy
-from fx_bharat.db.mongo_backend import MongoBackend
-from fx_bharat.db.mysql_backend import MySQLBackend
-from fx_bharat.db.postgres_backend import PostgresBackend
-from fx_bharat.db.sqlite_backend import SQLiteBackend
 from fx_bharat.db.sqlite_manager import PersistenceResult, SQLiteManager
 from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
 from fx_bharat.utils.logger import get_logger
 from fx_bharat.utils.rbi import RBI_MIN_AVAILABLE_DATE, enforce_rbi_min_date
 
-try:  # pragma: no cover - imported lazily
-    from sqlalchemy import create_engine, text
-except ModuleNotFoundError:  # pragma: no cover - dependency missing at runtime
-    create_engine = None  # type: ignore[misc,assignment]
-    text = None  # type: ignore[misc,assignment]
-
-try:  # pragma: no cover - imported lazily
-    from pymongo import MongoClient
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    MongoClient = None  # type: ignore[misc, assignment]
-
 if TYPE_CHECKING:  # pragma: no cover - typing-only import
+    import pandas as pd
+
+    from fx_bharat.db.sqlite_backend import SQLiteBackend
     from fx_bharat.seeds.populate_lme import SeedResult
 
 __all__ = [
@@ -59,47 +68,104 @@ except importlib_metadata.PackageNotFoundError:  # pragma: no cover - fallback f
 
 LOGGER = get_logger(__name__)
 
+SourceFilter = Literal["rbi", "sbi"]
+
+_RATE_DATE = attrgetter("rate_date")
+_CURRENCY = attrgetter("currency")
+
+_VALID_FREQUENCIES = frozenset({"daily", "weekly", "monthly", "yearly"})
+_VALID_SOURCES = frozenset({"rbi", "sbi"})
+
+_DATABASE_NAME_RE = re.compile(r"(?<![?&])DATABASE_NAME=", re.IGNORECASE)
+
+# Driver helpers used only by ``FxBharat.connection()``. They are imported on first
+# use and cached as module globals (``None`` when the package is missing), so
+# importing fx_bharat does not pay for them and tests can still monkeypatch them.
+_OPTIONAL_IMPORTS: dict[str, tuple[str, str]] = {
+    "create_engine": ("sqlalchemy", "create_engine"),
+    "text": ("sqlalchemy", "text"),
+    "MongoClient": ("pymongo", "MongoClient"),
+}
+
+
+def _optional_import(name: str) -> Any:
+    namespace = globals()
+    if name not in namespace:
+        module_name, attribute = _OPTIONAL_IMPORTS[name]
+        try:
+            namespace[name] = getattr(importlib.import_module(module_name), attribute)
+        except ModuleNotFoundError:
+            namespace[name] = None
+    return namespace[name]
 
-def seed_rbi_forex(*args, **kwargs):
-    from fx_bharat.seeds.populate_rbi_forex import seed_rbi_forex as _seed_rbi_forex
 
-    return _seed_rbi_forex(*args, **kwargs)
+# Backend strategies are imported when first needed, so SQLite-only callers never
+# load the MongoDB/MySQL/Postgres modules (or their drivers). Resolved classes are
+# cached as module globals, which keeps ``fx_bharat.SQLiteBackend`` patchable.
+_LAZY_BACKENDS: dict[str, str] = {
+    "SQLiteBackend": "fx_bharat.db.sqlite_backend",
+    "MySQLBackend": "fx_bharat.db.mysql_backend",
+    "PostgresBackend": "fx_bharat.db.postgres_backend",
+    "MongoBackend": "fx_bharat.db.mongo_backend",
+}
 
 
-def seed_sbi_forex(*args, **kwargs):
-    from fx_bharat.seeds.populate_sbi_forex import seed_sbi_forex as _seed_sbi_forex
+def _backend_class(name: str) -> Any:
+    namespace = globals()
+    if name not in namespace:
+        namespace[name] = getattr(importlib.import_module(_LAZY_BACKENDS[name]), name)
+    return namespace[name]
 
-    return _seed_sbi_forex(*args, **kwargs)
 
+_SEED_MODULES: dict[str, ModuleType] = {}
 
-def seed_sbi_historical(*args, **kwargs):
-    from fx_bharat.seeds.populate_sbi_forex import seed_sbi_historical as _seed_sbi_historical
 
-    return _seed_sbi_historical(*args, **kwargs)
+def _lazy_seed(name: str, module_name: str) -> Callable[..., Any]:
+    """Return a wrapper that imports ``module_name`` on first call and delegates to ``name``.
 
+    Only the module is cached; the function is looked up on every call so patching
+    it on its home module (as tests do) still takes effect.
+    """
 
-def seed_sbi_today(*args, **kwargs):
-    from fx_bharat.seeds.populate_sbi_forex import seed_sbi_today as _seed_sbi_today
+    def _seed(*args: Any, **kwargs: Any) -> Any:
+        module = _SEED_MODULES.get(module_name)
+        if module is None:
+            module = _SEED_MODULES[module_name] = importlib.import_module(module_name)
+        return getattr(module, name)(*args, **kwargs)
 
-    return _seed_sbi_today(*args, **kwargs)
+    _seed.__name__ = _seed.__qualname__ = name
+    _seed.__doc__ = f"Lazily import and call ``{module_name}.{name}``."
+    return _seed
 
 
-def seed_lme_prices(*args, **kwargs):
-    from fx_bharat.seeds.populate_lme import seed_lme_prices as _seed_lme_prices
+_WriteMethod = TypeVar("_WriteMethod", bound=Callable[..., Any])
 
-    return _seed_lme_prices(*args, **kwargs)
 
+def _invalidates_rate_cache(method: _WriteMethod) -> _WriteMethod:
+    """Invalidate cached ``rate()`` results before and after a write method runs.
 
-def seed_lme_copper(*args, **kwargs):
-    from fx_bharat.seeds.populate_lme import seed_lme_copper as _seed_lme_copper
+    The second invalidation runs even when the write fails part-way, so snapshots
+    another instance cached while rows were still being written are discarded too.
+    """
 
-    return _seed_lme_copper(*args, **kwargs)
+    @wraps(method)
+    def _wrapper(self: FxBharat, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate_rate_caches()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_rate_caches()
 
+    return cast(_WriteMethod, _wrapper)
 
-def seed_lme_aluminum(*args, **kwargs):
-    from fx_bharat.seeds.populate_lme import seed_lme_aluminum as _seed_lme_aluminum
 
-    return _seed_lme_aluminum(*args, **kwargs)
+seed_rbi_forex = _lazy_seed("seed_rbi_forex", "fx_bharat.seeds.populate_rbi_forex")
+seed_sbi_forex = _lazy_seed("seed_sbi_forex", "fx_bharat.seeds.populate_sbi_forex")
+seed_sbi_historical = _lazy_seed("seed_sbi_historical", "fx_bharat.seeds.populate_sbi_forex")
+seed_sbi_today = _lazy_seed("seed_sbi_today", "fx_bharat.seeds.populate_sbi_forex")
+seed_lme_prices = _lazy_seed("seed_lme_prices", "fx_bharat.seeds.populate_lme")
+seed_lme_copper = _lazy_seed("seed_lme_copper", "fx_bharat.seeds.populate_lme")
+seed_lme_aluminum = _lazy_seed("seed_lme_aluminum", "fx_bharat.seeds.populate_lme")
 
 
 class DatabaseBackend(str, Enum):
@@ -118,22 +184,16 @@ class DatabaseBackend(str, Enum):
             raise ValueError("DB_URL must include a scheme (e.g. mysql:// or postgres://)")
         scheme_lower = scheme.lower()
         base_scheme, _, driver = scheme_lower.partition("+")
-        if base_scheme in {"postgresql", "postgres", "postgressql"}:
-            return cls.POSTGRES, "postgresql"
-        if base_scheme == "sqlite":
-            return cls.SQLITE, "sqlite"
-        if base_scheme == "mysql":
-            # Preserve optional driver hints such as ``mysql+pymysql``.
-            canonical_scheme = scheme_lower if driver else "mysql"
-            return cls.MYSQL, canonical_scheme
-        if base_scheme == "mongodb":
-            # Keep srv-style schemes intact so pymongo can route via DNS.
-            canonical_scheme = scheme_lower if driver else "mongodb"
-            return cls.MONGODB, canonical_scheme
-        raise ValueError(
-            "Unsupported database backend. Supported values are SQLite, MySQL, "
-            "Postgres, and MongoDB."
-        )
+        entry = _SCHEME_TABLE.get(base_scheme)
+        if entry is None:
+            raise ValueError(
+                "Unsupported database backend. Supported values are SQLite, MySQL, "
+                "Postgres, and MongoDB."
+            )
+        backend, canonical_scheme, keeps_driver = entry
+        if driver and keeps_driver:
+            return backend, scheme_lower
+        return backend, canonical_scheme
 
     @classmethod
     def from_scheme(cls, scheme: str) -> "DatabaseBackend":
@@ -143,6 +203,19 @@ class DatabaseBackend(str, Enum):
         return backend
 
 
+# Base URL scheme -> (backend, canonical scheme, keep ``+driver`` suffix). MySQL keeps
+# driver hints such as ``mysql+pymysql`` and MongoDB keeps ``mongodb+srv`` so pymongo
+# can route via DNS; Postgres/SQLite always normalise to their bare scheme.
+_SCHEME_TABLE: dict[str, tuple[DatabaseBackend, str, bool]] = {
+    "postgresql": (DatabaseBackend.POSTGRES, "postgresql", False),
+    "postgres": (DatabaseBackend.POSTGRES, "postgresql", False),
+    "postgressql": (DatabaseBackend.POSTGRES, "postgresql", False),
+    "sqlite": (DatabaseBackend.SQLITE, "sqlite", False),
+    "mysql": (DatabaseBackend.MYSQL, "mysql", True),
+    "mongodb": (DatabaseBackend.MONGODB, "mongodb", True),
+}
+
+
 @dataclass(slots=True)
 class DatabaseConnectionInfo:
     """Represents how FxBharat should talk to the persistence layer."""
@@ -159,14 +232,18 @@ class DatabaseConnectionInfo:
     def from_url(cls, url: str) -> "DatabaseConnectionInfo":
         """Create a connection object by parsing a database URL/DSN."""
 
-        cleaned_url, query_db_name = cls._normalise_database_name_parameter(url)
-        parsed = urlparse(cleaned_url)
+        # Parse once and unparse once: the cleaned components are reused for every
+        # field below instead of re-parsing the normalised URL.
+        parsed, query_db_name = cls._split_database_name_parameter(url)
         if not parsed.scheme:
             raise ValueError("DB_URL must include a scheme (e.g. mysql:// or postgres://)")
         backend, canonical_scheme = DatabaseBackend.resolve_backend_and_scheme(parsed.scheme)
-        if parsed.scheme != canonical_scheme:
+        if url.startswith(f"{canonical_scheme}:") and "database_name" not in url.lower():
+            # Nothing was rewritten, so the caller's DSN is already the cleaned URL.
+            cleaned_url = url
+        else:
             parsed = parsed._replace(scheme=canonical_scheme)
-            cleaned_url = urlunparse(parsed)
+            cleaned_url = urlunsplit(parsed)
         resolved_port = parsed.port
         resolved_name = parsed.path[1:] if parsed.path and parsed.path != "/" else None
         if not resolved_name:
@@ -183,35 +260,33 @@ class DatabaseConnectionInfo:
         )
 
     @staticmethod
-    def _normalise_database_name_parameter(url: str) -> tuple[str, str | None]:
-        """Support custom ``DATABASE_NAME`` query parameters used in examples."""
-
+    def _split_database_name_parameter(url: str) -> tuple[SplitResult, str | None]:
+        if "database_name" not in url.lower():
+            # Common case: nothing to extract, so leave the query string untouched.
+            return urlsplit(url), None
         # Some callers append ``DATABASE_NAME=foo`` without an ``&`` delimiter. Make
         # sure that parameter is parsed as its own key/value pair.
-        patched_url = re.sub(
-            r"(?i)(?<![?&])DATABASE_NAME=",
-            "&DATABASE_NAME=",
-            url,
-        )
-        parsed = urlparse(patched_url)
-        query_pairs = parse_qsl(parsed.query, keep_blank_values=True)
-        remaining_pairs: list[tuple[str, str]] = []
+        parsed = urlsplit(_DATABASE_NAME_RE.sub("&DATABASE_NAME=", url))
+        remaining_params: list[str] = []
         database_name: str | None = None
-        for key, value in query_pairs:
+        # Scan the raw ``key=value`` segments so the other parameters are passed
+        # through verbatim instead of being decoded and re-encoded.
+        for param in parsed.query.split("&"):
+            if not param:
+                continue
+            key, _, value = param.partition("=")
             if key.lower() == "database_name":
                 if value:
-                    database_name = value
+                    database_name = unquote_plus(value)
                 # Strip the custom parameter so PyMongo/SQLAlchemy don't error on it.
                 continue
-            remaining_pairs.append((key, value))
+            remaining_params.append(param)
 
         new_path = parsed.path
         if (not new_path or new_path == "/") and database_name:
             new_path = f"/{database_name}"
 
-        new_query = urlencode(remaining_pairs, doseq=True)
-        cleaned = parsed._replace(query=new_query, path=new_path)
-        return urlunparse(cleaned), database_name
+        return parsed._replace(query="&".join(remaining_params), path=new_path), database_name
 
     @property
     def is_sqlite(self) -> bool:
@@ -223,13 +298,35 @@ class DatabaseConnectionInfo:
     def is_external(self) -> bool:
         """Return True for MySQL/Postgres/MongoDB backends."""
 
-        return not self.is_sqlite
+        return self.backend is not DatabaseBackend.SQLITE
+
+
+# The lambdas look the backend classes up when called, so they are imported lazily
+# and patched module attributes (as used in tests) are honoured.
+_EXTERNAL_BUILDERS: dict[DatabaseBackend, Callable[[DatabaseConnectionInfo], BackendStrategy]] = {
+    DatabaseBackend.POSTGRES: lambda info: _backend_class("PostgresBackend")(info.url),
+    DatabaseBackend.MYSQL: lambda info: _backend_class("MySQLBackend")(info.url),
+    DatabaseBackend.MONGODB: lambda info: _backend_class("MongoBackend")(
+        info.url, database=info.name
+    ),
+}
 
 
 class FxBharat:
     """Package facade that centralises DB configuration."""
 
-    __slots__ = ("connection_info", "sqlite_manager", "backend", "_backend_strategy")
+    __slots__ = (
+        "connection_info",
+        "sqlite_manager",
+        "backend",
+        "_backend_strategy",
+        "_rate_cache",
+        "_probe_engine",
+        "_sqlite_source",
+        "_sqlite_db_path",
+        "_shared_manager",
+        "_data_key",
+    )
 
     _DRIVER_HINTS: dict[DatabaseBackend, str] = {
         DatabaseBackend.POSTGRES: "Install psycopg2 or psycopg2-binary via 'pip install psycopg2-binary'.",
@@ -240,6 +337,23 @@ class FxBharat:
     # Provide direct access to the package version as a class attribute.
     __version__ = __version__
 
+    # RBI/SBI publish once per business day, so cached ``rate()`` results stay
+    # fresh for a while; seeding or migrating clears the cache immediately.
+    RATE_CACHE_TTL_SECONDS: float = 15 * 60
+
+    # Write generation per database (resolved SQLite path or external URL). Seeding
+    # through any instance bumps it, so cached ``rate()`` results on every other
+    # instance reading the same database are discarded too.
+    _DATA_GENERATIONS: dict[str, int] = {}
+    _DATA_GENERATIONS_LOCK = threading.Lock()
+
+    # SQLite managers are shared per database file so repeated ``FxBharat()``
+    # calls (common in notebooks) skip re-opening the file and re-checking the schema.
+    # Entries hold (file identity, manager, reference count); the last ``close()``
+    # on an instance using a manager closes it and drops the entry.
+    _SQLITE_MANAGERS: dict[tuple[Any, Path], tuple[int | None, SQLiteManager, int]] = {}
+    _SQLITE_MANAGERS_LOCK = threading.Lock()
+
     def __init__(
         self,
         db_config: DatabaseConnectionInfo | str | None = None,
@@ -260,13 +374,31 @@ class FxBharat:
         self.backend = self.connection_info.backend.value
         self.sqlite_manager: SQLiteManager | None = None
         self._backend_strategy: BackendStrategy | None = None
+        self._rate_cache: dict[
+            tuple[date | None, tuple[str, ...]], tuple[float, int, List[Dict[str, Any]]]
+        ] = {}
+        self._probe_engine: Any = None
+        self._sqlite_source: SQLiteBackend | None = None
+        self._sqlite_db_path: Path = DEFAULT_SQLITE_DB_PATH
+        self._shared_manager: SQLiteManager | None = None
         self._initialise_backend()
+        self._data_key = (
+            self._sqlite_data_key(self._sqlite_db_path)
+            if self.connection_info.is_sqlite
+            else self.connection_info.url
+        )
 
     @staticmethod
     def _build_connection_info(
         *,
         db_config: DatabaseConnectionInfo | str | None,
     ) -> DatabaseConnectionInfo:
+        # Exact type checks cover the usual inputs; isinstance() keeps subclasses working.
+        config_type = type(db_config)
+        if config_type is DatabaseConnectionInfo:
+            return cast(DatabaseConnectionInfo, db_config)
+        if config_type is str:
+            return DatabaseConnectionInfo.from_url(cast(str, db_config))
         if isinstance(db_config, DatabaseConnectionInfo):
             return db_config
         if isinstance(db_config, str):
@@ -288,21 +420,79 @@ class FxBharat:
         backend = self.connection_info.backend
         if backend is DatabaseBackend.SQLITE:
             db_path = Path(self.connection_info.name or DEFAULT_SQLITE_DB_PATH)
-            manager = SQLiteManager(db_path)
+            manager = self._shared_sqlite_manager(db_path)
+            self._shared_manager = manager
             self.sqlite_manager = manager
-            self._backend_strategy = SQLiteBackend(db_path=db_path, manager=manager)
+            self._sqlite_db_path = Path(manager.db_path)
+            self._backend_strategy = _backend_class("SQLiteBackend")(
+                db_path=db_path, manager=manager
+            )
         else:
             self.sqlite_manager = None
 
+    @classmethod
+    def _shared_sqlite_manager(cls, db_path: Path) -> SQLiteManager:
+        # Keyed by the factory too, so a patched ``SQLiteManager`` never reuses a
+        # manager built by another one.
+        factory = SQLiteManager
+        key = (factory, db_path.expanduser().resolve())
+        with cls._SQLITE_MANAGERS_LOCK:
+            cached = cls._SQLITE_MANAGERS.get(key)
+            if cached is not None:
+                identity, manager, refs = cached
+                if identity == cls._file_identity(key[1]):
+                    cls._SQLITE_MANAGERS[key] = (identity, manager, refs + 1)
+                    return manager
+                # The file was removed or replaced since it was opened; the old
+                # handle points at stale data, so close it before rebuilding.
+                manager.close()
+            manager = factory(db_path)
+            cls._SQLITE_MANAGERS[key] = (cls._file_identity(key[1]), manager, 1)
+            return manager
+
+    @classmethod
+    def _release_sqlite_manager(cls, manager: SQLiteManager) -> None:
+        with cls._SQLITE_MANAGERS_LOCK:
+            for key, (identity, cached, refs) in cls._SQLITE_MANAGERS.items():
+                if cached is not manager:
+                    continue
+                if refs > 1:
+                    cls._SQLITE_MANAGERS[key] = (identity, cached, refs - 1)
+                    return
+                del cls._SQLITE_MANAGERS[key]
+                break
+            else:
+                # Already closed when its file was replaced.
+                return
+        manager.close()
+
+    @staticmethod
+    def _file_identity(path: Path) -> int | None:
+        try:
+            return path.stat().st_ino
+        except FileNotFoundError:
+            return None
+
+    def _get_sqlite_source(self) -> SQLiteBackend:
+        """Return the bundled SQLite backend used as the source for mirroring.
+
+        External configurations mirror from the bundled database on every
+        ``seed()``/``migrate()``; the backend wraps the same shared manager used for
+        checkpoints, so the bundled file is opened only once.
+        """
+
+        if self._sqlite_source is None:
+            self._sqlite_source = _backend_class("SQLiteBackend")(
+                self._sqlite_db_path, manager=self._seed_sqlite_manager(self._sqlite_db_path)
+            )
+        return self._sqlite_source
+
     def _build_external_backend(self) -> BackendStrategy:
         backend = self.connection_info.backend
-        if backend is DatabaseBackend.POSTGRES:
-            return PostgresBackend(self.connection_info.url)
-        if backend is DatabaseBackend.MYSQL:
-            return MySQLBackend(self.connection_info.url)
-        if backend is DatabaseBackend.MONGODB:
-            return MongoBackend(self.connection_info.url, database=self.connection_info.name)
-        raise ValueError(f"Unsupported backend: {backend}")
+        builder = _EXTERNAL_BUILDERS.get(backend)
+        if builder is None:
+            raise ValueError(f"Unsupported backend: {backend}")
+        return builder(self.connection_info)
 
     def _get_backend_strategy(self) -> BackendStrategy:
         if self._backend_strategy is None:
@@ -316,75 +506,70 @@ class FxBharat:
 
         return self.connection_info.is_sqlite
 
+    @_invalidates_rate_cache
     def migrate(
         self,
         from_date: date | None = None,
         to_date: date | None = None,
         *,
-        chunk_size: int = 1000,
+        chunk_size: int | None = None,
+        parallelism: int = 1,
     ) -> None:
-        """Migrate the bundled SQLite data into the configured external backend."""
+        """Migrate the bundled SQLite data into the configured external backend.
+
+        ``chunk_size`` controls how many rows are sent per bulk write. When
+        omitted, the target backend's ``default_chunk_size`` is used (5000 for
+        MySQL/Postgres bulk upserts, 1000 for MongoDB bulk writes).
+        ``parallelism`` writes that many chunks concurrently, each on its own
+        pooled connection, which helps when round-trip latency dominates.
+        """
 
         if self.connection_info.is_sqlite:
             raise ValueError("Migration only supported for external databases.")
-        if chunk_size <= 0:
+        if chunk_size is not None and chunk_size <= 0:
             raise ValueError("chunk_size must be a positive integer")
+        if parallelism <= 0:
+            raise ValueError("parallelism must be a positive integer")
         if from_date and to_date and from_date > to_date:
             raise ValueError("from_date must be on or before to_date")
-        source_backend = SQLiteBackend(DEFAULT_SQLITE_DB_PATH)
-        try:
-            rbi_rows = source_backend.fetch_range(from_date, to_date, source="RBI")
-            sbi_rows = source_backend.fetch_range(from_date, to_date, source="SBI")
-            rows = rbi_rows + sbi_rows
-            lme_fetcher = getattr(source_backend, "fetch_lme_range", None)
-            lme_copper: list[LmeRateRecord] = []
-            lme_aluminum: list[LmeRateRecord] = []
-            if callable(lme_fetcher):
-                lme_copper = cast(list[LmeRateRecord], lme_fetcher("COPPER", from_date, to_date))
-                lme_aluminum = cast(
-                    list[LmeRateRecord], lme_fetcher("ALUMINUM", from_date, to_date)
-                )
-        finally:
-            source_backend.close()
+        source_backend = self._get_sqlite_source()
         target_backend = self._get_backend_strategy()
         target_backend.ensure_schema()
-        total_forex = len(rows)
-        if total_forex:
-            LOGGER.info("Migrating %s forex rows in chunks of %s", total_forex, chunk_size)
-            migrated = 0
-            for start in range(0, total_forex, chunk_size):
-                chunk = rows[start : start + chunk_size]
-                result = target_backend.insert_rates(chunk)
-                migrated += result.total
-                LOGGER.info("Migrated %s/%s forex rows", migrated, total_forex)
-        lme_batches: dict[str, list[LmeRateRecord]] = {
-            "COPPER": lme_copper,
-            "ALUMINUM": lme_aluminum,
-        }
-        for metal, lme_rows in lme_batches.items():
-            if lme_rows:
-                total_lme = len(lme_rows)
-                LOGGER.info(
-                    "Migrating %s LME %s rows in chunks of %s", total_lme, metal, chunk_size
-                )
-                migrated = 0
-                for start in range(0, total_lme, chunk_size):
-                    lme_chunk = lme_rows[start : start + chunk_size]
-                    result = target_backend.insert_lme_rates(metal, lme_chunk)
-                    migrated += result.total
-                    LOGGER.info("Migrated %s/%s LME %s rows", migrated, total_lme, metal)
+        if chunk_size is None:
+            chunk_size = getattr(
+                target_backend, "default_chunk_size", BackendStrategy.default_chunk_size
+            )
         checkpoints: dict[str, date] = {}
-        if rbi_rows:
-            checkpoints["RBI"] = max(row.rate_date for row in rbi_rows)
-        if sbi_rows:
-            checkpoints["SBI"] = max(row.rate_date for row in sbi_rows)
-        if lme_copper:
-            checkpoints["LME_COPPER"] = max(row.rate_date for row in lme_copper)
-        if lme_aluminum:
-            checkpoints["LME_ALUMINUM"] = max(row.rate_date for row in lme_aluminum)
+
+        def _forex_batches() -> Iterator[Sequence[ForexRateRecord]]:
+            for source in ("RBI", "SBI"):
+                for batch in self._iter_rate_batches(
+                    source_backend, from_date, to_date, source, chunk_size
+                ):
+                    latest = max(row.rate_date for row in batch)
+                    if source not in checkpoints or latest > checkpoints[source]:
+                        checkpoints[source] = latest
+                    yield batch
+
+        self._write_in_chunks(_forex_batches(), target_backend.insert_rates, parallelism, "forex")
+        lme_fetcher = getattr(source_backend, "fetch_lme_range", None)
+        if callable(lme_fetcher):
+            for metal in ("COPPER", "ALUMINUM"):
+                lme_rows = cast(list[LmeRateRecord], lme_fetcher(metal, from_date, to_date))
+                if not lme_rows:
+                    continue
+                self._write_in_chunks(
+                    self._slice_batches(lme_rows, chunk_size),
+                    partial(target_backend.insert_lme_rates, metal),
+                    parallelism,
+                    f"LME {metal}",
+                )
+                checkpoints[f"LME_{metal}"] = max(row.rate_date for row in lme_rows)
         for source, checkpoint in checkpoints.items():
             target_backend.update_ingestion_checkpoint(source, checkpoint)
+        self._refresh_statistics(target_backend)
 
+    @_invalidates_rate_cache
     def seed(
         self,
         from_date: date | None = None,
@@ -394,18 +579,19 @@ class FxBharat:
         resource_dir: str | Path | None = None,
         incremental: bool = True,
         dry_run: bool = False,
+        cache_dir: str | Path | None = None,
     ) -> None:
-        """Seed forex data into SQLite and mirror into external backends."""
+        """Seed forex data into SQLite and mirror into external backends.
+
+        ``cache_dir`` caches parsed SBI PDFs by content hash, so repeated seeds over
+        unchanged archives skip PDF text extraction.
+        """
 
         if from_date and to_date and from_date > to_date:
             raise ValueError("from_date must be on or before to_date")
 
         today = date.today()
-        sqlite_db_path = (
-            Path(self.sqlite_manager.db_path)
-            if self.sqlite_manager is not None
-            else DEFAULT_SQLITE_DB_PATH
-        )
+        sqlite_db_path = self._sqlite_db_path
 
         target_sources = self._normalise_source_filter(source.lower() if source else None)
         resolved_to = to_date or today
@@ -443,6 +629,7 @@ class FxBharat:
                     download=False,
                     incremental=incremental if not user_range_specified else False,
                     dry_run=dry_run,
+                    cache_dir=cache_dir,
                 )
             if include_today:
                 seed_sbi_today(
@@ -460,18 +647,21 @@ class FxBharat:
             return None
 
         if self.connection_info.is_external:
-            sqlite_backend = SQLiteBackend(db_path=sqlite_db_path)
-            try:
-                rows: list[ForexRateRecord] = []
-                for start, end, src in mirror_windows:
-                    rows.extend(sqlite_backend.fetch_range(start, end, source=src))
-            finally:
-                sqlite_backend.close()
-
+            sqlite_backend = self._get_sqlite_source()
             target_backend = self._get_backend_strategy()
             target_backend.ensure_schema()
-            target_backend.insert_rates(rows)
+            batch_size = getattr(
+                target_backend, "default_chunk_size", BackendStrategy.default_chunk_size
+            )
+            batches = (
+                batch
+                for start, end, src in mirror_windows
+                for batch in self._iter_rate_batches(sqlite_backend, start, end, src, batch_size)
+            )
+            self._write_in_chunks(batches, target_backend.insert_rates, 1, "forex")
+            self._refresh_statistics(target_backend)
 
+    @_invalidates_rate_cache
     def seed_lme(
         self,
         metal: Literal["COPPER", "ALUMINUM"],
@@ -482,11 +672,7 @@ class FxBharat:
     ) -> PersistenceResult:
         """Seed LME prices into SQLite and mirror to an external backend if configured."""
 
-        sqlite_db_path = (
-            Path(self.sqlite_manager.db_path)
-            if self.sqlite_manager is not None
-            else DEFAULT_SQLITE_DB_PATH
-        )
+        sqlite_db_path = self._sqlite_db_path
         seed_result = cast(
             "SeedResult",
             seed_lme_prices(
@@ -503,39 +689,111 @@ class FxBharat:
         if self.connection_info.is_external:
             backend = self._get_backend_strategy()
             backend.ensure_schema()
-            with SQLiteManager(sqlite_db_path) as manager:
-                lme_rows = manager.fetch_lme_range(metal, from_date, to_date)
-            backend.insert_lme_rates(metal, lme_rows)
+            manager = self._seed_sqlite_manager(sqlite_db_path)
+            lme_rows = manager.fetch_lme_range(metal, from_date, to_date)
+            chunk_size = getattr(backend, "default_chunk_size", BackendStrategy.default_chunk_size)
+            self._write_in_chunks(
+                self._slice_batches(lme_rows, chunk_size),
+                partial(backend.insert_lme_rates, metal),
+                1,
+                f"LME {metal}",
+            )
         return seed_result.rows
 
     def rate(
         self,
         rate_date: date | None = None,
         *,
-        source_filter: Literal["rbi", "sbi", None] = None,
+        source_filter: SourceFilter | Sequence[SourceFilter] | None = None,
     ) -> List[Dict[str, Any]]:
-        """Return a forex rate snapshot for ``rate_date`` or the latest entry."""
+        """Return a forex rate snapshot for ``rate_date`` or the latest entry.
+
+        ``source_filter`` accepts a single source (``"rbi"``/``"sbi"``) or a
+        sequence such as ``("rbi", "sbi")``. All requested sources are read with
+        a single backend query and split per source afterwards. Results are
+        cached in-process for :attr:`RATE_CACHE_TTL_SECONDS`.
+        """
+
+        sources = self._normalise_source_filter(source_filter)
+        if rate_date is not None and "RBI" in sources:
+            enforce_rbi_min_date(rate_date)
+        cache_key = (rate_date, sources)
+        generation = self._DATA_GENERATIONS.get(self._data_key, 0)
+        cached = self._rate_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached[1] == generation
+            and time.monotonic() - cached[0] < self.RATE_CACHE_TTL_SECONDS
+        ):
+            return self._copy_snapshots(cached[2])
 
         backend = self._get_backend_strategy()
         snapshots: List[Dict[str, Any]] = []
-        sources = self._normalise_source_filter(source_filter)
 
+        query_source = sources[0] if len(sources) == 1 else None
+        if rate_date is not None:
+            rows = backend.fetch_range(rate_date, rate_date, source=query_source)
+        else:
+            try:
+                rows = backend.fetch_latest(source=query_source)
+            except NotImplementedError:
+                rows = backend.fetch_range(source=query_source)
+        rows_by_source = self._split_rows_by_source(rows)
         for source in sources:
-            if rate_date is not None and source == "RBI":
-                enforce_rbi_min_date(rate_date)
-            rows = (
-                backend.fetch_range(rate_date, rate_date, source=source)
-                if rate_date is not None
-                else backend.fetch_range(source=source)
+            snapshot = self._latest_snapshot_from_rows(
+                rows_by_source.get(source, []), rate_date, source
             )
-            snapshot = self._latest_snapshot_from_rows(rows, rate_date, source)
             if snapshot:
                 snapshots.append(snapshot)
 
-        return sorted(
-            snapshots,
-            key=lambda snap: (0 if snap["source"] == "SBI" else 1, snap["rate_date"]),
+        # ``sources`` is already in canonical SBI-first order with one snapshot each.
+        self._rate_cache[cache_key] = (
+            time.monotonic(),
+            generation,
+            self._copy_snapshots(snapshots),
         )
+        return snapshots
+
+    def clear_rate_cache(self) -> None:
+        """Drop cached :meth:`rate` results (done automatically by seed/migrate).
+
+        Other instances reading the same database drop their cached results too.
+        """
+
+        self._bump_data_generation(self._data_key)
+        self._rate_cache.clear()
+
+    def _invalidate_rate_caches(self) -> None:
+        # Seeding an external config also writes the bundled SQLite database, so
+        # instances reading that file are invalidated as well.
+        self.clear_rate_cache()
+        if self.connection_info.is_external:
+            self._bump_data_generation(self._sqlite_data_key(self._sqlite_db_path))
+
+    @classmethod
+    def _bump_data_generation(cls, data_key: str) -> None:
+        with cls._DATA_GENERATIONS_LOCK:
+            cls._DATA_GENERATIONS[data_key] = cls._DATA_GENERATIONS.get(data_key, 0) + 1
+
+    @staticmethod
+    def _sqlite_data_key(db_path: Path) -> str:
+        return str(db_path.expanduser().resolve())
+
+    @staticmethod
+    def _copy_snapshots(snapshots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Snapshot values are dates, strings and floats apart from ``rates`` (and the
+        # per-currency dicts SBI snapshots carry), so copying those levels is enough
+        # to keep callers from mutating cached results.
+        return [
+            {
+                **snapshot,
+                "rates": {
+                    currency: dict(value) if isinstance(value, dict) else value
+                    for currency, value in snapshot["rates"].items()
+                },
+            }
+            for snapshot in snapshots
+        ]
 
     def history(
         self,
@@ -543,7 +801,7 @@ class FxBharat:
         to_date: date,
         frequency: Literal["daily", "weekly", "monthly", "yearly"] = "daily",
         *,
-        source_filter: Literal["rbi", "sbi", None] = None,
+        source_filter: SourceFilter | Sequence[SourceFilter] | None = None,
     ) -> List[Dict[str, Any]]:
         """Return forex rate snapshots within ``from_date``/``to_date``.
 
@@ -551,31 +809,102 @@ class FxBharat:
         buckets always return the latest snapshot in each interval.
         """
 
+        return list(self.iter_history(from_date, to_date, frequency, source_filter=source_filter))
+
+    def iter_history(
+        self,
+        from_date: date,
+        to_date: date,
+        frequency: Literal["daily", "weekly", "monthly", "yearly"] = "daily",
+        *,
+        source_filter: SourceFilter | Sequence[SourceFilter] | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the snapshots of :meth:`history` one at a time (SBI first, then RBI).
+
+        Arguments are validated immediately. Each source is only queried once
+        iteration reaches it and snapshot dictionaries are built on demand, so
+        ``itertools.islice(fx.iter_history(...), 2)`` stops after two snapshots.
+        """
+
         if from_date > to_date:
             raise ValueError("from_date must not be after to_date")
         freq = frequency.lower()
-        if freq not in {"daily", "weekly", "monthly", "yearly"}:
+        if freq not in _VALID_FREQUENCIES:
             raise ValueError("frequency must be one of: daily, weekly, monthly, yearly")
-        snapshots: List[Dict[str, Any]] = []
+        sources = self._normalise_source_filter(source_filter)
+        if "RBI" in sources:
+            enforce_rbi_min_date(from_date, to_date)
         backend = self._get_backend_strategy()
+        return self._iter_history_snapshots(backend, from_date, to_date, freq, sources)
 
-        for source in self._normalise_source_filter(source_filter):
-            if source == "RBI":
-                enforce_rbi_min_date(from_date, to_date)
-            rows = backend.fetch_range(from_date, to_date, source=source)
+    def _iter_history_snapshots(
+        self,
+        backend: BackendStrategy,
+        from_date: date,
+        to_date: date,
+        frequency: str,
+        sources: tuple[str, ...],
+    ) -> Iterator[Dict[str, Any]]:
+        for source in sources:
+            rows = self._fetch_history_rows(backend, from_date, to_date, source, frequency)
             grouped = self._group_rows_by_date(rows)
             if not grouped:
                 continue
-            sorted_dates = sorted(grouped.keys())
-            selected = self._select_snapshot_dates(sorted_dates, freq)
-            snapshots.extend(
-                [self._snapshot_payload(day, grouped[day], source) for day in selected]
-            )
+            # Sort the currency codes once per source rather than once per snapshot.
+            currency_order = sorted({row.currency for row in rows})
+            if frequency == "daily":
+                # Every date is kept, so walk the groups directly instead of re-hashing.
+                selected: Iterable[tuple[date, List[ForexRateRecord]]] = grouped.items()
+            else:
+                selected = (
+                    (day, grouped[day]) for day in self._select_snapshot_dates(grouped, frequency)
+                )
+            for day, day_rows in selected:
+                yield self._snapshot_payload(day, day_rows, source, currency_order)
 
-        return sorted(
-            snapshots,
-            key=lambda snap: (0 if snap["source"] == "SBI" else 1, snap["rate_date"]),
-        )
+    def history_frame(
+        self,
+        from_date: date,
+        to_date: date,
+        frequency: Literal["daily", "weekly", "monthly", "yearly"] = "daily",
+        *,
+        source_filter: SourceFilter | Sequence[SourceFilter] | None = None,
+    ) -> "pd.DataFrame":
+        """Return forex history as a pandas DataFrame for analytics and charts.
+
+        The frame is indexed by ``(source, rate_date)`` and holds one ``float64``
+        column per currency, built straight from the fetched rows without the
+        per-day dictionaries :meth:`history` creates. SBI-only fields such as
+        ``tt_buy`` are not included.
+        """
+
+        import pandas as pd
+
+        if from_date > to_date:
+            raise ValueError("from_date must not be after to_date")
+        freq = frequency.lower()
+        if freq not in _VALID_FREQUENCIES:
+            raise ValueError("frequency must be one of: daily, weekly, monthly, yearly")
+        backend = self._get_backend_strategy()
+        sources = self._normalise_source_filter(source_filter)
+        records: list[tuple[str, date, str, float]] = []
+
+        for source in sources:
+            if source == "RBI":
+                enforce_rbi_min_date(from_date, to_date)
+            rows = self._fetch_history_rows(backend, from_date, to_date, source, freq)
+            if freq != "daily":
+                selected = set(self._select_snapshot_dates(map(_RATE_DATE, rows), freq))
+                rows = [row for row in rows if row.rate_date in selected]
+            records.extend((source, row.rate_date, row.currency, row.rate) for row in rows)
+
+        frame = pd.DataFrame.from_records(
+            records, columns=["source", "rate_date", "currency", "rate"]
+        ).astype({"rate": "float64"})
+        wide = frame.pivot(index=["source", "rate_date"], columns="currency", values="rate")
+        wide.columns.name = None
+        # Keep the SBI-first ordering used by history().
+        return wide.reindex(sources, level="source")
 
     def history_lme(
         self,
@@ -590,21 +919,24 @@ class FxBharat:
         if from_date > to_date:
             raise ValueError("from_date must not be after to_date")
         freq = frequency.lower()
-        if freq not in {"daily", "weekly", "monthly", "yearly"}:
+        if freq not in _VALID_FREQUENCIES:
             raise ValueError("frequency must be one of: daily, weekly, monthly, yearly")
         snapshots: List[Dict[str, Any]] = []
         backend = self._get_backend_strategy()
 
         for metal in self._normalise_lme_filter(source_filter):
             rows = backend.fetch_lme_range(metal, from_date, to_date)
-            grouped = self._group_lme_rows_by_date(rows)
-            if not grouped:
+            rows_by_date = self._index_lme_rows_by_date(rows)
+            if not rows_by_date:
                 continue
-            sorted_dates = sorted(grouped.keys())
-            selected = self._select_snapshot_dates(sorted_dates, freq)
-            snapshots.extend(
-                [self._lme_snapshot_payload(day, grouped[day], metal) for day in selected]
-            )
+            if freq == "daily":
+                selected: Iterable[tuple[date, LmeRateRecord]] = rows_by_date.items()
+            else:
+                selected = (
+                    (day, rows_by_date[day])
+                    for day in self._select_snapshot_dates(rows_by_date, freq)
+                )
+            snapshots.extend([self._lme_snapshot_payload(day, row, metal) for day, row in selected])
 
         return sorted(snapshots, key=lambda snap: (snap["rate_date"], snap["metal"]))
 
@@ -624,7 +956,7 @@ class FxBharat:
         to_date: date,
         frequency: Literal["daily", "weekly", "monthly", "yearly"] = "daily",
         *,
-        source_filter: Literal["rbi", "sbi", None] = None,
+        source_filter: SourceFilter | Sequence[SourceFilter] | None = None,
     ) -> List[Dict[str, Any]]:
         """Deprecated alias; use :meth:`history` instead."""
 
@@ -635,29 +967,125 @@ class FxBharat:
         )
         return self.history(from_date, to_date, frequency=frequency, source_filter=source_filter)
 
+    @staticmethod
+    def _iter_rate_batches(
+        backend: BackendStrategy,
+        start: date | None,
+        end: date | None,
+        source: str | None,
+        batch_size: int,
+    ) -> Iterator[Sequence[ForexRateRecord]]:
+        fetch_iter = getattr(backend, "fetch_range_iter", None)
+        if callable(fetch_iter):
+            return cast(
+                Iterator[Sequence[ForexRateRecord]],
+                fetch_iter(start, end, source=source, batch_size=batch_size),
+            )
+        return FxBharat._slice_batches(backend.fetch_range(start, end, source=source), batch_size)
+
+    @staticmethod
+    def _slice_batches(rows: Sequence[Any], batch_size: int) -> Iterator[Sequence[Any]]:
+        return (rows[start : start + batch_size] for start in range(0, len(rows), batch_size))
+
+    @staticmethod
+    def _write_in_chunks(
+        chunks: Iterable[Sequence[Any]],
+        write: Callable[[Sequence[Any]], PersistenceResult],
+        parallelism: int,
+        label: str,
+    ) -> None:
+        # Chunks are pulled lazily so at most ``parallelism`` of them are held in
+        # memory (and in flight) at any time, however large the source range is.
+        # Writes run on worker threads while this thread reads the next chunk, so
+        # the source read overlaps the target write even with ``parallelism=1``.
+        # Reads stay on the calling thread because sqlite3 connections are bound to
+        # the thread that opened them.
+        migrated = 0
+        pending: deque[tuple[Future[PersistenceResult], int]] = deque()
+
+        def _finish_oldest() -> None:
+            nonlocal migrated
+            future, size = pending.popleft()
+            future.result()
+            migrated += size
+            LOGGER.info("Migrated %s %s rows", migrated, label)
+
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            for chunk in chunks:
+                if len(pending) >= parallelism:
+                    _finish_oldest()
+                pending.append((executor.submit(write, chunk), len(chunk)))
+            while pending:
+                _finish_oldest()
+
+    @staticmethod
+    def _refresh_statistics(backend: BackendStrategy) -> None:
+        refresh = getattr(backend, "refresh_statistics", None)
+        if callable(refresh):
+            refresh()
+
+    @staticmethod
+    def _fetch_history_rows(
+        backend: BackendStrategy,
+        from_date: date,
+        to_date: date,
+        source: str,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        if frequency in {"monthly", "yearly"}:
+            # Let the database pick the last date per bucket so only those rows are
+            # transferred; backends without support fall back to a full range read.
+            try:
+                return backend.fetch_period_end_range(
+                    from_date, to_date, source=source, frequency=frequency
+                )
+            except NotImplementedError:
+                pass
+        return backend.fetch_range(from_date, to_date, source=source)
+
     def _get_ingestion_checkpoint(self, sqlite_db_path: Path, source: str) -> date | None:
-        if self.sqlite_manager is not None:
-            return self.sqlite_manager.ingestion_checkpoint(source)
-        with SQLiteManager(sqlite_db_path) as manager:
-            return manager.ingestion_checkpoint(source)
+        return self._seed_sqlite_manager(sqlite_db_path).ingestion_checkpoint(source)
+
+    def _seed_sqlite_manager(self, sqlite_db_path: Path) -> SQLiteManager:
+        manager = self.sqlite_manager or self._shared_manager
+        if manager is None:
+            # External configs read checkpoints and LME mirrors from the bundled
+            # database; hold one reference to the shared manager until close().
+            manager = self._shared_manager = self._shared_sqlite_manager(sqlite_db_path)
+        return manager
 
     @staticmethod
     def _group_rows_by_date(
         rows: Iterable[ForexRateRecord],
     ) -> Dict[date, List[ForexRateRecord]]:
+        # Backends return rows ordered by date, so consecutive runs share a date and
+        # each run costs one dict operation instead of one per row. Out-of-order
+        # input is still merged correctly.
         grouped: Dict[date, List[ForexRateRecord]] = {}
-        for row in rows:
-            grouped.setdefault(row.rate_date, []).append(row)
+        for rate_date, run in groupby(rows, key=_RATE_DATE):
+            existing = grouped.get(rate_date)
+            if existing is None:
+                grouped[rate_date] = list(run)
+            else:
+                existing.extend(run)
         return grouped
 
     @staticmethod
-    def _group_lme_rows_by_date(
-        rows: Iterable[LmeRateRecord],
-    ) -> Dict[date, List[LmeRateRecord]]:
-        grouped: Dict[date, List[LmeRateRecord]] = {}
+    def _split_rows_by_source(
+        rows: Iterable[ForexRateRecord],
+    ) -> Dict[str, List[ForexRateRecord]]:
+        split: Dict[str, List[ForexRateRecord]] = {}
         for row in rows:
-            grouped.setdefault(row.rate_date, []).append(row)
-        return grouped
+            split.setdefault((row.source or "RBI").upper(), []).append(row)
+        return split
+
+    @staticmethod
+    def _index_lme_rows_by_date(
+        rows: Iterable[LmeRateRecord],
+    ) -> Dict[date, LmeRateRecord]:
+        # LME tables hold one row per date; if a backend ever returns duplicates the
+        # last one wins, matching the previous "latest row of the group" behaviour.
+        return {row.rate_date: row for row in rows}
 
     @staticmethod
     def _latest_snapshot_from_rows(
@@ -676,13 +1104,22 @@ class FxBharat:
 
     @staticmethod
     def _snapshot_payload(
-        rate_date: date, rates: List[ForexRateRecord], source: str
+        rate_date: date,
+        rates: List[ForexRateRecord],
+        source: str,
+        currency_order: Sequence[str] | None = None,
     ) -> Dict[str, Any]:
+        if currency_order is None:
+            # Sort the rows once and build the payload in that order; a stable sort
+            # keeps the last row for a repeated currency, as a dict overwrite would.
+            ordered_rows: Iterable[ForexRateRecord] = sorted(rates, key=_CURRENCY)
+        else:
+            by_currency = {row.currency: row for row in rates}
+            ordered_rows = [by_currency[code] for code in currency_order if code in by_currency]
         ordered_rates: Dict[str, Any]
         if source.upper() == "SBI":
-            payload_rates: Dict[str, Dict[str, float | None]] = {}
-            for row in rates:
-                payload_rates[row.currency] = {
+            ordered_rates = {
+                row.currency: {
                     "rate": row.rate,
                     "tt_buy": row.tt_buy,
                     "tt_sell": row.tt_sell,
@@ -693,9 +1130,10 @@ class FxBharat:
                     "cn_buy": row.cn_buy,
                     "cn_sell": row.cn_sell,
                 }
-            ordered_rates = dict(sorted(payload_rates.items()))
+                for row in ordered_rows
+            }
         else:
-            ordered_rates = dict(sorted({row.currency: row.rate for row in rates}.items()))
+            ordered_rates = {row.currency: row.rate for row in ordered_rows}
 
         return {
             "rate_date": rate_date,
@@ -705,10 +1143,7 @@ class FxBharat:
         }
 
     @staticmethod
-    def _lme_snapshot_payload(
-        rate_date: date, rates: List[LmeRateRecord], metal: str
-    ) -> Dict[str, Any]:
-        row = rates[-1]
+    def _lme_snapshot_payload(rate_date: date, row: LmeRateRecord, metal: str) -> Dict[str, Any]:
         return {
             "rate_date": rate_date,
             "metal": metal,
@@ -718,14 +1153,14 @@ class FxBharat:
         }
 
     @staticmethod
-    def _select_snapshot_dates(dates: List[date], frequency: str) -> List[date]:
+    def _select_snapshot_dates(dates: Iterable[date], frequency: str) -> List[date]:
+        # ``dates`` arrive in ascending order because every backend reads with
+        # ``ORDER BY rate_date``; the bucketed result inherits that order.
         if frequency == "daily":
-            return dates
+            return list(dates)
         if frequency == "weekly":
-            return FxBharat._last_dates_by_key(
-                dates,
-                lambda value: (value.isocalendar().year, value.isocalendar().week),
-            )
+            # One isocalendar() call per date; the (year, week) slice is the bucket key.
+            return FxBharat._last_dates_by_key(dates, lambda value: value.isocalendar()[:2])
         if frequency == "monthly":
             return FxBharat._last_dates_by_key(dates, lambda value: (value.year, value.month))
         if frequency == "yearly":
@@ -737,22 +1172,31 @@ class FxBharat:
         dates: Iterable[date],
         key_builder: Callable[[date], Any],
     ) -> List[date]:
+        # Single pass keeping the latest date per bucket; repeated dates are harmless.
         buckets: Dict[Any, date] = {}
         for day in dates:
             key = key_builder(day)
-            if key not in buckets or day > buckets[key]:
+            if buckets.get(key, day) <= day:
                 buckets[key] = day
-        return sorted(buckets.values())
+        # Buckets are created in date order, so their values are already ascending.
+        return list(buckets.values())
 
     @staticmethod
     def _normalise_source_filter(
-        source_filter: str | None = None,
+        source_filter: str | Sequence[str] | None = None,
     ) -> tuple[str, ...]:
         if source_filter is None:
             return ("SBI", "RBI")
-        if source_filter.lower() not in {"rbi", "sbi"}:
-            raise ValueError("source_filter must be one of 'rbi', 'sbi', or None")
-        return (source_filter.upper(),)
+        requested = (source_filter,) if isinstance(source_filter, str) else tuple(source_filter)
+        if not requested or any(
+            not isinstance(value, str) or value.lower() not in _VALID_SOURCES for value in requested
+        ):
+            raise ValueError(
+                "source_filter must be 'rbi', 'sbi', a sequence of those values, or None"
+            )
+        wanted = {value.upper() for value in requested}
+        # Keep the canonical SBI-first ordering regardless of the caller's order.
+        return tuple(source for source in ("SBI", "RBI") if source in wanted)
 
     @staticmethod
     def _normalise_lme_filter(
@@ -778,6 +1222,23 @@ class FxBharat:
 
         return self.connection()
 
+    def close(self) -> None:
+        """Release the probe engine, the cached SQLite source, and any external backend.
+
+        The SQLite manager is shared with other instances for the same file; it is
+        closed once the last instance using it is closed.
+        """
+
+        self._dispose_probe_engine()
+        if self._shared_manager is not None:
+            manager, self._shared_manager = self._shared_manager, None
+            self._release_sqlite_manager(manager)
+        # The mirror source wraps the shared manager released above.
+        self._sqlite_source = None
+        if self.connection_info.is_external and self._backend_strategy is not None:
+            backend, self._backend_strategy = self._backend_strategy, None
+            backend.close()
+
     def _missing_driver_message(self, exc: ModuleNotFoundError) -> str:
         """Return a user-friendly hint when an optional DB driver is missing."""
 
@@ -794,32 +1255,43 @@ class FxBharat:
     def _probe_relational_db(self) -> tuple[bool, str | None]:
         """Ping SQLite/MySQL/Postgres backends via SQLAlchemy."""
 
+        create_engine = _optional_import("create_engine")
+        text = _optional_import("text")
         if create_engine is None or text is None:  # pragma: no cover - defensive
             return False, "SQLAlchemy is required to perform connectivity checks"
 
-        engine = None
         try:
-            engine = create_engine(self.connection_info.url, future=True)
-            with engine.connect() as conn:
+            # Reuse one pooled engine so repeated checks only pay for ``SELECT 1``;
+            # pre-ping replaces connections the server dropped between probes.
+            if self._probe_engine is None:
+                self._probe_engine = create_engine(
+                    self.connection_info.url, future=True, pool_pre_ping=True
+                )
+            with self._probe_engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
         except ModuleNotFoundError as exc:
+            self._dispose_probe_engine()
             return False, self._missing_driver_message(exc)
         except Exception as exc:  # pragma: no cover - SQLAlchemy provides error detail
+            self._dispose_probe_engine()
             return False, str(exc)
-        finally:
-            if engine is not None:
-                engine.dispose()
         return True, None
 
+    def _dispose_probe_engine(self) -> None:
+        engine, self._probe_engine = self._probe_engine, None
+        if engine is not None:
+            engine.dispose()
+
     def _probe_mongodb(self) -> tuple[bool, str | None]:
         """Ping MongoDB using pymongo since SQLAlchemy lacks a native dialect."""
 
-        if MongoClient is None:
+        mongo_client = _optional_import("MongoClient")
+        if mongo_client is None:
             return False, self._missing_driver_message(ModuleNotFoundError("pymongo"))
 
-        client: MongoClient | None = None
+        client: Any = None
         try:
-            client = MongoClient(self.connection_info.url, serverSelectionTimeoutMS=5000)
+            client = mongo_client(self.connection_info.url, serverSelectionTimeoutMS=5000)
             client.admin.command("ping")
         except ModuleNotFoundError as exc:
             return False, self._missing_driver_message(exc)
@@ -834,12 +1306,14 @@ class FxBharat:
 def __getattr__(name: str) -> Any:
     """Lazily import heavy helpers to avoid mandatory Selenium installs."""
 
-    if name == "seed_rbi_forex":
-        from fx_bharat.seeds.populate_rbi_forex import seed_rbi_forex as _seed
-
-        return _seed
+    if name in _OPTIONAL_IMPORTS:
+        return _optional_import(name)
+    if name in _LAZY_BACKENDS:
+        return _backend_class(name)
     if name == "RBISeleniumClient":
         from fx_bharat.ingestion.rbi_selenium import RBISeleniumClient as _client
 
+        # Cache in module globals so later lookups bypass ``__getattr__``.
+        globals()[name] = _client
         return _client
     raise AttributeError(f"module 'fx_bharat' has no attribute {name}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Final
 
@@ -9,9 +10,11 @@ __all__ = ["DEFAULT_SQLITE_DB_PATH", "bundled_sqlite_path"]
 
 # ``Path(__file__)`` points at ``fx_bharat/db/__init__.py`` so replacing the
 # filename gives us the location of ``forex.db`` irrespective of the working
-# directory. Using ``resolve`` ensures callers always receive an absolute path
-# which SQLite requires when the package is installed in site-packages.
-DEFAULT_SQLITE_DB_PATH: Final[Path] = Path(__file__).resolve().with_name("forex.db")
+# directory. ``abspath`` ensures callers always receive an absolute path, which
+# SQLite requires when the package is installed in site-packages, without the
+# per-directory ``stat`` calls ``resolve`` makes at import time; SQLiteManager
+# still resolves symlinks when it opens the file.
+DEFAULT_SQLITE_DB_PATH: Final[Path] = Path(os.path.abspath(__file__)).with_name("forex.db")
 
 
 def bundled_sqlite_path() -> Path:
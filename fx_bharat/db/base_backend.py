@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Sequence
+from typing import Iterator, Sequence
 
 from fx_bharat.db.sqlite_manager import PersistenceResult
 from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
@@ -13,6 +13,10 @@ from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
 class BackendStrategy(ABC):
     """Common interface implemented by every database backend."""
 
+    #: Rows sent per bulk write when callers such as ``FxBharat.migrate`` do not
+    #: specify a chunk size.
+    default_chunk_size: int = 1000
+
     @abstractmethod
     def ensure_schema(self) -> None:
         """Create required tables/collections and verify connectivity."""
@@ -29,7 +33,66 @@ class BackendStrategy(ABC):
         *,
         source: str | None = None,
     ) -> list[ForexRateRecord]:
-        """Return forex rates constrained by the provided dates."""
+        """Return forex rates constrained by the provided dates.
+
+        Rows must come back in ascending ``rate_date`` order; ``FxBharat.history``
+        returns snapshots in the order the backend yields them.
+        """
+
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        """Yield :meth:`fetch_range` results in lists of at most ``batch_size`` rows.
+
+        Batches keep the ascending ``rate_date`` order of :meth:`fetch_range`. The
+        default slices a fully materialised :meth:`fetch_range`; backends that can
+        stream from a server-side cursor override it to keep memory bounded.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        return self._iter_fetch_range_batches(start, end, source=source, batch_size=batch_size)
+
+    def _iter_fetch_range_batches(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+        batch_size: int,
+    ) -> Iterator[list[ForexRateRecord]]:
+        rows = self.fetch_range(start, end, source=source)
+        for offset in range(0, len(rows), batch_size):
+            yield rows[offset : offset + batch_size]
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        """Return forex rates for the last available date of each monthly/yearly bucket.
+
+        Backends that cannot bucket server-side raise ``NotImplementedError`` and
+        callers fall back to :meth:`fetch_range`.
+        """
+        msg = f"Period aggregation not implemented for backend {type(self).__name__}"
+        raise NotImplementedError(msg)
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        """Return the rates of the most recent ``rate_date`` for each requested source.
+
+        Backends without a dedicated lookup raise ``NotImplementedError`` and
+        callers fall back to :meth:`fetch_range`.
+        """
+        msg = f"Latest-rate lookup not implemented for backend {type(self).__name__}"
+        raise NotImplementedError(msg)
 
     def insert_lme_rates(self, metal: str, rows: Sequence[LmeRateRecord]) -> PersistenceResult:
         """Insert or update LME prices in bulk."""
@@ -48,6 +111,9 @@ class BackendStrategy(ABC):
         msg = f"Ingestion metadata not implemented for backend {type(self).__name__}"
         raise NotImplementedError(msg)
 
+    def refresh_statistics(self) -> None:
+        """Refresh planner statistics after bulk loads; no-op unless overridden."""
+
     def close(self) -> None:  # pragma: no cover - optional cleanup hook
         """Backends may override to release connections/resources."""
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
+from functools import partial
+from itertools import islice
+from typing import Any, Iterator, Sequence
 
 from fx_bharat.db.base_backend import BackendStrategy
 from fx_bharat.db.sqlite_manager import PersistenceResult
@@ -22,10 +25,69 @@ except ModuleNotFoundError:  # pragma: no cover - handled dynamically
 
 LOGGER = get_logger(__name__)
 
+_PERIOD_FORMATS = {"monthly": "%Y-%m", "yearly": "%Y"}
+_FOREX_KEY_FIELDS = ("rate_date", "currency_code")
+# Only the fields the record builders read; skips ``_id``, ``created_at`` and
+# ``base_currency`` on the wire and in BSON decoding.
+_FOREX_PROJECTION = {
+    "_id": 0,
+    "rate_date": 1,
+    "currency_code": 1,
+    "currency": 1,
+    "rate": 1,
+    "tt_buy": 1,
+    "tt_sell": 1,
+    "bill_buy": 1,
+    "bill_sell": 1,
+    "travel_card_buy": 1,
+    "travel_card_sell": 1,
+    "cn_buy": 1,
+    "cn_sell": 1,
+}
+_LME_PROJECTION = {"_id": 0, "rate_date": 1, "price": 1, "price_3_month": 1, "stock": 1}
+
+
+def _bson_date(value: date) -> datetime:
+    """Return ``value`` as the midnight ``datetime`` PyMongo encodes as a BSON Date."""
+
+    return datetime.combine(value, time.min)
+
+
+def _forex_document(row: ForexRateRecord, created_at: datetime) -> dict[str, Any]:
+    """Build the stored document for ``row``, omitting unset SBI card/TT fields."""
+
+    doc: dict[str, Any] = {
+        "rate_date": _bson_date(row.rate_date),
+        "currency_code": row.currency,
+        "rate": row.rate,
+        "base_currency": "INR",
+        "created_at": created_at,
+    }
+    # Inline checks instead of a per-row dict of optional fields to filter.
+    if row.tt_buy is not None:
+        doc["tt_buy"] = row.tt_buy
+    if row.tt_sell is not None:
+        doc["tt_sell"] = row.tt_sell
+    if row.bill_buy is not None:
+        doc["bill_buy"] = row.bill_buy
+    if row.bill_sell is not None:
+        doc["bill_sell"] = row.bill_sell
+    if row.travel_card_buy is not None:
+        doc["travel_card_buy"] = row.travel_card_buy
+    if row.travel_card_sell is not None:
+        doc["travel_card_sell"] = row.travel_card_sell
+    if row.cn_buy is not None:
+        doc["cn_buy"] = row.cn_buy
+    if row.cn_sell is not None:
+        doc["cn_sell"] = row.cn_sell
+    return doc
+
 
 class MongoBackend(BackendStrategy):
     """Backend strategy that persists forex rates inside MongoDB."""
 
+    default_chunk_size = 1000
+
     def __init__(self, url: str, *, database: str | None = None) -> None:
         if MongoClient is None:  # pragma: no cover - defensive
             raise ModuleNotFoundError("pymongo is required for MongoDB backends")
@@ -39,7 +101,6 @@ class MongoBackend(BackendStrategy):
         self._lme_copper_collection: Collection = db["lme_copper_rates"]
         self._lme_aluminum_collection: Collection = db["lme_aluminum_rates"]
         self._ingestion_collection: Collection = db["ingestion_metadata"]
-        self._collection: Collection | None = None
 
     @staticmethod
     def _normalise_metal(metal: str) -> str:
@@ -54,65 +115,71 @@ class MongoBackend(BackendStrategy):
         try:
             LOGGER.info("Ensuring MongoDB forex rate collections exist")
             self._client.admin.command("ping")
-            self._rbi_collection.create_index([("rate_date", 1), ("currency_code", 1)], unique=True)
-            self._sbi_collection.create_index([("rate_date", 1), ("currency_code", 1)], unique=True)
-            self._lme_copper_collection.create_index([("rate_date", 1)], unique=True)
-            self._lme_aluminum_collection.create_index([("rate_date", 1)], unique=True)
+            # ``background`` keeps pre-4.2 servers accepting writes while an index
+            # builds on a populated collection; newer servers ignore the option.
+            for collection in (self._rbi_collection, self._sbi_collection):
+                collection.create_index(
+                    [("rate_date", 1), ("currency_code", 1)], unique=True, background=True
+                )
+            for collection in (self._lme_copper_collection, self._lme_aluminum_collection):
+                collection.create_index([("rate_date", 1)], unique=True, background=True)
             self._ingestion_collection.create_index([("source", 1)], unique=True)
         except PyMongoError as exc:  # pragma: no cover - error path
             raise RuntimeError(f"Failed to ensure MongoDB schema: {exc}") from exc
 
-    def insert_rates(self, rows: Sequence[ForexRateRecord]) -> PersistenceResult:
+    def _bulk_write(
+        self,
+        collection: Collection,
+        docs: Sequence[dict[str, Any]],
+        key_fields: tuple[str, ...],
+        *,
+        upsert: bool = True,
+    ) -> None:
+        # Send at most ``default_chunk_size`` documents per round trip so large
+        # inserts stay well below the server's batch limits.
+        size = self.default_chunk_size
+        for offset in range(0, len(docs), size):
+            chunk = docs[offset : offset + size]
+            if not upsert:
+                # Plain inserts skip the lookup each upsert performs on the server.
+                collection.insert_many(chunk, ordered=False)
+                continue
+            operations = [
+                UpdateOne({field: doc[field] for field in key_fields}, {"$set": doc}, upsert=True)
+                for doc in chunk
+            ]
+            collection.bulk_write(operations, ordered=False)
+
+    def insert_rates(
+        self, rows: Sequence[ForexRateRecord], *, upsert: bool = True
+    ) -> PersistenceResult:
+        """Upsert forex rows into the RBI/SBI collections.
+
+        Pass ``upsert=False`` for cold loads into empty collections: documents are
+        written with ``insert_many`` instead, and existing dates raise a
+        duplicate-key error rather than being updated.
+        """
+
         result = PersistenceResult()
         if not rows:
             return result
-        rbi_ops: list[UpdateOne] = []
-        sbi_ops: list[UpdateOne] = []
+        rbi_docs: list[dict[str, Any]] = []
+        sbi_docs: list[dict[str, Any]] = []
+        # One timestamp per call: every document in the batch is created together.
+        now = datetime.utcnow()
+        # Records normally carry an upper-case source, so most rows resolve with one
+        # dict lookup; anything else falls back to the normalised comparison.
+        buckets = {"SBI": sbi_docs, "RBI": rbi_docs}
         for row in rows:
-            target_ops = sbi_ops if (row.source or "RBI").upper() == "SBI" else rbi_ops
-            doc = {
-                "rate_date": row.rate_date.isoformat(),
-                "currency_code": row.currency,
-                "rate": row.rate,
-                "base_currency": "INR",
-                "created_at": datetime.utcnow(),
-            }
-            optional_fields = {
-                "tt_buy": row.tt_buy,
-                "tt_sell": row.tt_sell,
-                "bill_buy": row.bill_buy,
-                "bill_sell": row.bill_sell,
-                "travel_card_buy": row.travel_card_buy,
-                "travel_card_sell": row.travel_card_sell,
-                "cn_buy": row.cn_buy,
-                "cn_sell": row.cn_sell,
-            }
-            for key, value in optional_fields.items():
-                if value is not None:
-                    doc[key] = value
-            target_ops.append(
-                UpdateOne(
-                    {
-                        "rate_date": doc["rate_date"],
-                        "currency_code": doc["currency_code"],
-                    },
-                    {"$set": doc},
-                    upsert=True,
-                )
-            )
+            target_docs = buckets.get(row.source)
+            if target_docs is None:
+                target_docs = sbi_docs if (row.source or "RBI").upper() == "SBI" else rbi_docs
+            target_docs.append(_forex_document(row, now))
         try:
-            rbi_collection = getattr(self, "_rbi_collection", None)
-            if rbi_collection is None:
-                rbi_collection = getattr(self, "_collection", None)
-
-            sbi_collection = getattr(self, "_sbi_collection", None)
-            if sbi_collection is None:
-                sbi_collection = getattr(self, "_collection", None)
-
-            if rbi_ops and rbi_collection is not None:
-                rbi_collection.bulk_write(rbi_ops, ordered=False)
-            if sbi_ops and sbi_collection is not None:
-                sbi_collection.bulk_write(sbi_ops, ordered=False)
+            if rbi_docs:
+                self._bulk_write(self._rbi_collection, rbi_docs, _FOREX_KEY_FIELDS, upsert=upsert)
+            if sbi_docs:
+                self._bulk_write(self._sbi_collection, sbi_docs, _FOREX_KEY_FIELDS, upsert=upsert)
             result.inserted += len(rows)
         except PyMongoError as exc:  # pragma: no cover - error path
             raise RuntimeError(f"Failed to insert MongoDB rates: {exc}") from exc
@@ -126,24 +193,19 @@ class MongoBackend(BackendStrategy):
         target_collection = (
             self._lme_copper_collection if normalised == "COPPER" else self._lme_aluminum_collection
         )
-        operations: list[UpdateOne] = []
-        for row in rows:
-            doc = {
-                "rate_date": row.rate_date.isoformat(),
+        now = datetime.utcnow()
+        docs = [
+            {
+                "rate_date": _bson_date(row.rate_date),
                 "price": row.price,
                 "price_3_month": row.price_3_month,
                 "stock": row.stock,
-                "created_at": datetime.utcnow(),
+                "created_at": now,
             }
-            operations.append(
-                UpdateOne(
-                    {"rate_date": doc["rate_date"]},
-                    {"$set": doc},
-                    upsert=True,
-                )
-            )
+            for row in rows
+        ]
         try:
-            target_collection.bulk_write(operations, ordered=False)
+            self._bulk_write(target_collection, docs, ("rate_date",))
             result.inserted += len(rows)
         except PyMongoError as exc:  # pragma: no cover - error path
             raise RuntimeError(f"Failed to insert MongoDB LME rates: {exc}") from exc
@@ -170,52 +232,143 @@ class MongoBackend(BackendStrategy):
         *,
         source: str | None = None,
     ) -> list[ForexRateRecord]:
-        def _collection_query(collection: Collection) -> list[ForexRateRecord]:
-            query: dict[str, Any] = {}
-            if start is not None or end is not None:
-                range_query: dict[str, str] = {}
-                if start is not None:
-                    range_query["$gte"] = start.isoformat()
-                if end is not None:
-                    range_query["$lte"] = end.isoformat()
-                query["rate_date"] = range_query
-            docs = collection.find(query).sort("rate_date", 1)
-            source_label = "RBI"
-            if getattr(collection, "name", "").endswith("sbi"):
-                source_label = "SBI"
-            return [
-                ForexRateRecord(
-                    rate_date=date.fromisoformat(doc["rate_date"]),
-                    currency=doc.get("currency_code", doc.get("currency", "")),
-                    rate=float(doc["rate"]),
-                    source=source_label,
-                    tt_buy=doc.get("tt_buy"),
-                    tt_sell=doc.get("tt_sell"),
-                    bill_buy=doc.get("bill_buy"),
-                    bill_sell=doc.get("bill_sell"),
-                    travel_card_buy=doc.get("travel_card_buy"),
-                    travel_card_sell=doc.get("travel_card_sell"),
-                    cn_buy=doc.get("cn_buy"),
-                    cn_sell=doc.get("cn_sell"),
-                )
-                for doc in docs
-            ]
+        return self._fetch_forex_rows(start, end, source=source)
+
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        return self._batched(self._iter_forex_rows(start, end, source=source), batch_size)
+
+    @staticmethod
+    def _batched(
+        records: Iterator[ForexRateRecord], batch_size: int
+    ) -> Iterator[list[ForexRateRecord]]:
+        # Records are decoded straight from the cursor, so at most one batch is
+        # held in memory at a time.
+        while batch := list(islice(records, batch_size)):
+            yield batch
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        try:
+            period_format = _PERIOD_FORMATS[frequency.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported period frequency: {frequency}") from None
+        return self._fetch_forex_rows(start, end, source=source, period_format=period_format)
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(None, None, source=source, latest_only=True)
+
+    def _fetch_forex_rows(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+        period_format: str | None = None,
+        latest_only: bool = False,
+    ) -> list[ForexRateRecord]:
+        collections = self._forex_collections(source)
+        query = partial(
+            self._collection_rows,
+            start=start,
+            end=end,
+            period_format=period_format,
+            latest_only=latest_only,
+        )
+        if len(collections) < 2:
+            return [record for target in collections for record in query(*target)]
+        # PyMongo releases the GIL on socket I/O, so the SBI and RBI round trips
+        # overlap; results are still concatenated SBI first.
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            per_collection = list(executor.map(lambda target: list(query(*target)), collections))
+        return [record for records in per_collection for record in records]
 
-        records: list[ForexRateRecord] = []
-        sbi_collection = getattr(self, "_sbi_collection", None)
-        if sbi_collection is None:
-            sbi_collection = getattr(self, "_collection", None)
+    def _iter_forex_rows(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+    ) -> Iterator[ForexRateRecord]:
+        for collection, source_label in self._forex_collections(source):
+            yield from self._collection_rows(collection, source_label, start=start, end=end)
 
-        rbi_collection = getattr(self, "_rbi_collection", None)
-        if rbi_collection is None:
-            rbi_collection = getattr(self, "_collection", None)
+    def _forex_collections(self, source: str | None) -> list[tuple[Collection, str]]:
+        collections: list[tuple[Collection, str]] = []
         if source is None or source.upper() == "SBI":
-            if sbi_collection is not None:
-                records.extend(_collection_query(sbi_collection))
+            collections.append((self._sbi_collection, "SBI"))
         if source is None or source.upper() == "RBI":
-            if rbi_collection is not None:
-                records.extend(_collection_query(rbi_collection))
-        return records
+            collections.append((self._rbi_collection, "RBI"))
+        return collections
+
+    @staticmethod
+    def _collection_rows(
+        collection: Collection,
+        source_label: str,
+        *,
+        start: date | None,
+        end: date | None,
+        period_format: str | None = None,
+        latest_only: bool = False,
+    ) -> Iterator[ForexRateRecord]:
+        query: dict[str, Any] = {}
+        if latest_only:
+            # Resolve the newest date from the rate_date index, then read that day.
+            latest = collection.find_one({}, {"rate_date": 1}, sort=[("rate_date", -1)])
+            if latest is None:
+                return
+            query["rate_date"] = latest["rate_date"]
+        if start is not None or end is not None:
+            range_query: dict[str, datetime] = {}
+            if start is not None:
+                range_query["$gte"] = _bson_date(start)
+            if end is not None:
+                range_query["$lte"] = _bson_date(end)
+            query["rate_date"] = range_query
+        if period_format is not None:
+            # Grouping by the formatted YYYY-MM / YYYY bucket yields the last
+            # available date of every period.
+            pipeline = [
+                {"$match": query},
+                {
+                    "$group": {
+                        "_id": {"$dateToString": {"format": period_format, "date": "$rate_date"}},
+                        "rate_date": {"$max": "$rate_date"},
+                    }
+                },
+            ]
+            period_ends = [doc["rate_date"] for doc in collection.aggregate(pipeline)]
+            query = {"rate_date": {"$in": period_ends}}
+        docs = collection.find(query, _FOREX_PROJECTION).sort("rate_date", 1)
+        for doc in docs:
+            yield ForexRateRecord(
+                rate_date=doc["rate_date"].date(),
+                currency=doc.get("currency_code", doc.get("currency", "")),
+                rate=float(doc["rate"]),
+                source=source_label,
+                tt_buy=doc.get("tt_buy"),
+                tt_sell=doc.get("tt_sell"),
+                bill_buy=doc.get("bill_buy"),
+                bill_sell=doc.get("bill_sell"),
+                travel_card_buy=doc.get("travel_card_buy"),
+                travel_card_sell=doc.get("travel_card_sell"),
+                cn_buy=doc.get("cn_buy"),
+                cn_sell=doc.get("cn_sell"),
+            )
 
     def fetch_lme_range(
         self, metal: str, start: date | None = None, end: date | None = None
@@ -226,16 +379,16 @@ class MongoBackend(BackendStrategy):
         )
         query: dict[str, Any] = {}
         if start is not None or end is not None:
-            date_query: dict[str, str] = {}
+            date_query: dict[str, datetime] = {}
             if start is not None:
-                date_query["$gte"] = start.isoformat()
+                date_query["$gte"] = _bson_date(start)
             if end is not None:
-                date_query["$lte"] = end.isoformat()
+                date_query["$lte"] = _bson_date(end)
             query["rate_date"] = date_query
-        docs = target_collection.find(query).sort("rate_date", 1)
+        docs = target_collection.find(query, _LME_PROJECTION).sort("rate_date", 1)
         return [
             LmeRateRecord(
-                rate_date=date.fromisoformat(doc["rate_date"]),
+                rate_date=doc["rate_date"].date(),
                 price=doc.get("price"),
                 price_3_month=doc.get("price_3_month"),
                 stock=doc.get("stock"),
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Mapping, Sequence, SupportsFloat, SupportsIndex, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, Sequence, SupportsFloat, SupportsIndex, cast
 
 from fx_bharat.db.base_backend import BackendStrategy
 from fx_bharat.db.sqlite_manager import PersistenceResult
@@ -11,8 +12,9 @@ from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
 from fx_bharat.utils.logger import get_logger
 
 try:  # pragma: no cover - optional dependency
-    from sqlalchemy import create_engine, text
+    from sqlalchemy import Float, create_engine, text
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime
+    Float = None  # type: ignore[assignment,misc]
     create_engine = None  # type: ignore[assignment]
     text = None  # type: ignore[assignment]
 
@@ -23,6 +25,18 @@ else:  # pragma: no cover - fallback type used at runtime
 
 LOGGER = get_logger(__name__)
 
+# Pool settings for networked servers: reuse the most recently returned
+# connection, re-validate connections the server may have dropped while idle
+# and recycle them ahead of common MySQL ``wait_timeout`` values. SQLite URLs
+# keep SQLAlchemy's defaults because its pools reject the sizing arguments.
+SERVER_POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 10,
+    "max_overflow": 10,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+}
+
 SCHEMA_SQL_RBI = """
 CREATE TABLE IF NOT EXISTS forex_rates_rbi (
     rate_date DATE NOT NULL,
@@ -139,21 +153,145 @@ VALUES(:rate_date, :price, :price_3_month, :stock, :created_at)
 DELETE_LME_COPPER_SQL = "DELETE FROM lme_copper_rates WHERE rate_date = :rate_date"
 DELETE_LME_ALUMINUM_SQL = "DELETE FROM lme_aluminum_rates WHERE rate_date = :rate_date"
 
+RBI_COLUMNS = ("rate_date", "currency_code", "rate", "base_currency", "created_at")
+RBI_UPDATES = ("rate", "base_currency", "created_at")
+SBI_COLUMNS = (
+    "rate_date",
+    "currency_code",
+    "rate",
+    "base_currency",
+    "tt_buy",
+    "tt_sell",
+    "bill_buy",
+    "bill_sell",
+    "travel_card_buy",
+    "travel_card_sell",
+    "cn_buy",
+    "cn_sell",
+    "created_at",
+)
+SBI_UPDATES = SBI_COLUMNS[2:]
+FOREX_CONFLICT_COLUMNS = ("rate_date", "currency_code")
+LME_COLUMNS = ("rate_date", "price", "price_3_month", "stock", "created_at")
+LME_UPDATES = LME_COLUMNS[1:]
+LME_CONFLICT_COLUMNS = ("rate_date",)
+
+# Only the columns ForexRateRecord carries; base_currency/created_at stay server-side.
+RBI_SELECT_COLUMNS = ("rate_date", "currency_code", "rate")
+SBI_SELECT_COLUMNS = (
+    "rate_date",
+    "currency_code",
+    "rate",
+    "tt_buy",
+    "tt_sell",
+    "bill_buy",
+    "bill_sell",
+    "travel_card_buy",
+    "travel_card_sell",
+    "cn_buy",
+    "cn_sell",
+)
+
+# Numeric columns read back as floats rather than driver Decimals.
+RBI_FLOAT_COLUMNS = RBI_SELECT_COLUMNS[2:]
+SBI_FLOAT_COLUMNS = SBI_SELECT_COLUMNS[2:]
+
+# Most rows sent in one driver-level bulk upsert statement. Larger writes (LME
+# history, direct insert_rates() callers, a large migrate chunk_size) are split
+# into several statements inside the caller's transaction, keeping each one well
+# below server limits such as MySQL's max_allowed_packet. The caps match
+# ``RelationalBackend.default_chunk_size`` so default migrate chunks still go out
+# as a single statement.
+BULK_STATEMENT_ROWS: dict[str, int] = {"postgresql": 5000, "mysql": 5000}
+
+# Checkpoint upserts only ever move ``last_ingested_date`` forward.
+CHECKPOINT_UPSERT_SQL: dict[str, str] = {
+    "postgresql": """
+INSERT INTO ingestion_metadata(source, last_ingested_date)
+VALUES(:source, :last_ingested_date)
+ON CONFLICT(source) DO UPDATE
+SET last_ingested_date = EXCLUDED.last_ingested_date
+WHERE EXCLUDED.last_ingested_date > ingestion_metadata.last_ingested_date
+""",
+    "mysql": """
+INSERT INTO ingestion_metadata(source, last_ingested_date)
+VALUES(:source, :last_ingested_date)
+ON DUPLICATE KEY UPDATE
+last_ingested_date = IF(
+    VALUES(last_ingested_date) > last_ingested_date,
+    VALUES(last_ingested_date),
+    last_ingested_date
+)
+""",
+    "sqlite": """
+INSERT INTO ingestion_metadata(source, last_ingested_date)
+VALUES(:source, :last_ingested_date)
+ON CONFLICT(source) DO UPDATE
+SET last_ingested_date = excluded.last_ingested_date
+WHERE excluded.last_ingested_date > ingestion_metadata.last_ingested_date
+""",
+}
+CHECKPOINT_UPSERT_SQL["mariadb"] = CHECKPOINT_UPSERT_SQL["mysql"]
+
+# Forex rows arrive roughly in date order, so a BRIN index summarises ``rate_date``
+# in a few pages and serves multi-year range scans on Postgres.
+POSTGRES_BRIN_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_forex_rates_rbi_rate_date_brin "
+    "ON forex_rates_rbi USING BRIN (rate_date) WITH (pages_per_range = 32)",
+    "CREATE INDEX IF NOT EXISTS idx_forex_rates_sbi_rate_date_brin "
+    "ON forex_rates_sbi USING BRIN (rate_date) WITH (pages_per_range = 32)",
+)
+
+ANALYZED_TABLES = (
+    "forex_rates_rbi",
+    "forex_rates_sbi",
+    "lme_copper_rates",
+    "lme_aluminum_rates",
+)
+
+# Expressions used to bucket ``rate_date`` per dialect when selecting the last
+# available date of every month/year server-side.
+PERIOD_BUCKET_SQL: dict[str, dict[str, str]] = {
+    "postgresql": {
+        "monthly": "date_trunc('month', rate_date)",
+        "yearly": "date_trunc('year', rate_date)",
+    },
+    "mysql": {
+        "monthly": "EXTRACT(YEAR_MONTH FROM rate_date)",
+        "yearly": "YEAR(rate_date)",
+    },
+    "mariadb": {
+        "monthly": "EXTRACT(YEAR_MONTH FROM rate_date)",
+        "yearly": "YEAR(rate_date)",
+    },
+    "sqlite": {
+        "monthly": "substr(rate_date, 1, 7)",
+        "yearly": "substr(rate_date, 1, 4)",
+    },
+}
+
 
 class RelationalBackend(BackendStrategy):
     """Base class that encapsulates SQLAlchemy powered interactions."""
 
+    # execute_values / multi-row executemany amortise round-trips well beyond 1k rows.
+    default_chunk_size = 5000
+
     def __init__(self, url: str) -> None:
         if create_engine is None or text is None:  # pragma: no cover - defensive guard
             raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
         self.url = url
         self._engine_instance: Engine | None = None
+        self._dialect_name: str | None = None
 
     def _get_engine(self) -> Engine:
         if self._engine_instance is None:
             if create_engine is None:  # pragma: no cover - defensive guard
                 raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
-            self._engine_instance = create_engine(self.url, future=True)
+            options: dict[str, Any] = {}
+            if not str(self.url).startswith("sqlite"):
+                options = SERVER_POOL_OPTIONS
+            self._engine_instance = create_engine(self.url, future=True, **options)
         return self._engine_instance
 
     @staticmethod
@@ -178,6 +316,17 @@ class RelationalBackend(BackendStrategy):
             connection.execute(text(SCHEMA_SQL_LME_COPPER))
             connection.execute(text(SCHEMA_SQL_LME_ALUMINUM))
             self._ensure_lme_schema(connection)
+            self._ensure_range_indexes(connection)
+
+    def _ensure_range_indexes(self, connection) -> None:
+        """Create dialect-specific indexes for ``rate_date`` range scans."""
+
+        if text is None:  # pragma: no cover - defensive guard
+            raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
+        if connection.engine.dialect.name != "postgresql":
+            return
+        for statement in POSTGRES_BRIN_INDEX_SQL:
+            connection.execute(text(statement))
 
     def _ensure_lme_schema(self, connection) -> None:
         """Patch older schemas missing LME columns."""
@@ -191,59 +340,68 @@ class RelationalBackend(BackendStrategy):
             "stock": "NUMERIC(18, 6)",
             "created_at": "TIMESTAMP",
         }
-        unwanted_columns = {"usd_price", "eur_price", "usd_change", "eur_change"}
-        for table in ("lme_copper_rates", "lme_aluminum_rates"):
-            if dialect == "postgresql":
-                result = connection.execute(
-                    text(
-                        "SELECT column_name FROM information_schema.columns "
-                        "WHERE table_schema = current_schema() AND table_name = :table"
-                    ),
-                    {"table": table},
-                )
-                existing = {row[0] for row in result}
-            elif dialect in {"mysql", "mariadb"}:
-                result = connection.execute(text("SELECT DATABASE()"))
-                schema_name = result.scalar()
-                result = connection.execute(
-                    text(
-                        "SELECT column_name FROM information_schema.columns "
-                        "WHERE table_schema = :schema AND table_name = :table"
-                    ),
-                    {"schema": schema_name, "table": table},
-                )
-                existing = {row[0] for row in result}
-            elif dialect == "sqlite":
+        unwanted_columns = ("usd_price", "eur_price", "usd_change", "eur_change")
+        lme_tables = ("lme_copper_rates", "lme_aluminum_rates")
+        existing_by_table: dict[str, set[str]] = {table: set() for table in lme_tables}
+        # Postgres and MySQL report both tables' columns in one round trip.
+        table_params = {"copper_table": lme_tables[0], "aluminum_table": lme_tables[1]}
+        columns_sql = (
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = {schema} "
+            "AND table_name IN (:copper_table, :aluminum_table)"
+        )
+        if dialect == "postgresql":
+            result = connection.execute(
+                text(columns_sql.format(schema="current_schema()")), table_params
+            )
+            for table_name, column_name in result:
+                existing_by_table.setdefault(table_name, set()).add(column_name)
+        elif dialect in {"mysql", "mariadb"}:
+            schema_name = connection.execute(text("SELECT DATABASE()")).scalar()
+            result = connection.execute(
+                text(columns_sql.format(schema=":schema")),
+                {"schema": schema_name, **table_params},
+            )
+            for table_name, column_name in result:
+                existing_by_table.setdefault(table_name, set()).add(column_name)
+        elif dialect == "sqlite":
+            for table in lme_tables:
                 result = connection.execute(text(f"PRAGMA table_info({table})"))
-                existing = {row[1] for row in result}
-            else:  # pragma: no cover - unknown dialect
-                continue
+                existing_by_table[table] = {row[1] for row in result}
+        else:  # pragma: no cover - unknown dialect
+            return
 
+        for table in lme_tables:
+            existing = existing_by_table[table]
             missing = [name for name in lme_columns if name not in existing]
-            for column_name in missing:
-                connection.execute(
-                    text(
-                        f"ALTER TABLE {table} "
-                        f"ADD COLUMN {column_name} {lme_columns[column_name]}"
+            if missing and dialect == "sqlite":
+                # SQLite only accepts one ADD COLUMN per ALTER TABLE.
+                for column_name in missing:
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {table} "
+                            f"ADD COLUMN {column_name} {lme_columns[column_name]}"
+                        )
                     )
+            elif missing:
+                additions = ", ".join(
+                    f"ADD COLUMN {column_name} {lme_columns[column_name]}"
+                    for column_name in missing
                 )
+                connection.execute(text(f"ALTER TABLE {table} {additions}"))
             extra = [name for name in unwanted_columns if name in existing]
             if not extra:
                 continue
             if dialect == "postgresql":
-                for column_name in extra:
-                    connection.execute(
-                        text(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {column_name}")
-                    )
+                drops = ", ".join(f"DROP COLUMN IF EXISTS {column_name}" for column_name in extra)
+                connection.execute(text(f"ALTER TABLE {table} {drops}"))
             elif dialect in {"mysql", "mariadb"}:
-                for column_name in extra:
-                    connection.execute(text(f"ALTER TABLE {table} DROP COLUMN {column_name}"))
+                drops = ", ".join(f"DROP COLUMN {column_name}" for column_name in extra)
+                connection.execute(text(f"ALTER TABLE {table} {drops}"))
             elif dialect == "sqlite":
                 desired = ["rate_date", "price", "price_3_month", "stock", "created_at"]
                 temp_table = f"{table}_tmp"
-                connection.execute(
-                    text(
-                        f"""
+                connection.execute(text(f"""
                         CREATE TABLE {temp_table} (
                             rate_date DATE NOT NULL,
                             price NUMERIC(18, 6) NULL,
@@ -252,22 +410,56 @@ class RelationalBackend(BackendStrategy):
                             created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                             PRIMARY KEY(rate_date)
                         )
-                        """
-                    )
-                )
+                        """))
                 columns_csv = ", ".join(desired)
-                connection.execute(
-                    text(
-                        f"""
+                connection.execute(text(f"""
                         INSERT INTO {temp_table} ({columns_csv})
                         SELECT {columns_csv}
                         FROM {table}
-                        """
-                    )
-                )
+                        """))
                 connection.execute(text(f"DROP TABLE {table}"))
                 connection.execute(text(f"ALTER TABLE {temp_table} RENAME TO {table}"))
 
+    def _get_dialect(self) -> str:
+        # The dialect is fixed per engine; resolve it once per backend.
+        if self._dialect_name is None:
+            self._dialect_name = self._get_engine().dialect.name
+        return self._dialect_name
+
+    def _upsert_rows(
+        self,
+        connection,
+        table: str,
+        columns: tuple[str, ...],
+        conflict: tuple[str, ...],
+        updates: tuple[str, ...],
+        values: list[tuple[object, ...]],
+        delete_sql: str,
+        insert_sql: str,
+    ) -> None:
+        """Upsert ``values`` (tuples ordered like ``columns``) into ``table``."""
+
+        dialect = self._get_dialect()
+        if dialect == "postgresql":
+            if _postgres_bulk_upsert(connection, table, columns, conflict, updates, values):
+                return
+        elif dialect in {"mysql", "mariadb"}:
+            if _mysql_bulk_upsert(connection, table, columns, updates, values):
+                return
+        # Only the SQLAlchemy path binds by name, so build mappings just for it.
+        params_list = [dict(zip(columns, row)) for row in values]
+        upsert_sql = _build_upsert_sql(dialect, table, columns, conflict, updates)
+        if upsert_sql is None:
+            # No native upsert: replace rows with one DELETE and one INSERT
+            # executemany. Keep the last row per key so duplicates in the batch
+            # resolve the same way a row-by-row replace would.
+            latest = {tuple(params[col] for col in conflict): params for params in params_list}
+            unique_params = list(latest.values())
+            connection.execute(_cached_text(delete_sql), unique_params)
+            connection.execute(_cached_text(insert_sql), unique_params)
+        else:
+            connection.execute(_cached_text(upsert_sql), params_list)
+
     def insert_rates(self, rows: Sequence[ForexRateRecord]) -> PersistenceResult:
         result = PersistenceResult()
         if not rows:
@@ -275,214 +467,68 @@ class RelationalBackend(BackendStrategy):
         engine = self._get_engine()
         if text is None:  # pragma: no cover - defensive guard
             raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
-        dialect = engine.dialect.name
-
-        def _build_upsert_sql(
-            table: str,
-            columns: Sequence[str],
-            conflict: Sequence[str],
-            updates: Sequence[str],
-        ) -> str | None:
-            placeholders = ", ".join(f":{col}" for col in columns)
-            columns_csv = ", ".join(columns)
-            base = f"INSERT INTO {table}({columns_csv}) VALUES({placeholders})"
-            if dialect in {"postgresql", "sqlite"}:
-                update_csv = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates)
-                conflict_csv = ", ".join(conflict)
-                return f"{base} ON CONFLICT({conflict_csv}) DO UPDATE SET {update_csv}"
-            if dialect in {"mysql", "mariadb"}:
-                update_csv = ", ".join(f"{col} = VALUES({col})" for col in updates)
-                return f"{base} ON DUPLICATE KEY UPDATE {update_csv}"
-            return None
-
-        rbi_columns = ["rate_date", "currency_code", "rate", "base_currency", "created_at"]
-        rbi_updates = ["rate", "base_currency", "created_at"]
-        sbi_columns = [
-            "rate_date",
-            "currency_code",
-            "rate",
-            "base_currency",
-            "tt_buy",
-            "tt_sell",
-            "bill_buy",
-            "bill_sell",
-            "travel_card_buy",
-            "travel_card_sell",
-            "cn_buy",
-            "cn_sell",
-            "created_at",
-        ]
-        sbi_updates = [
-            "rate",
-            "base_currency",
-            "tt_buy",
-            "tt_sell",
-            "bill_buy",
-            "bill_sell",
-            "travel_card_buy",
-            "travel_card_sell",
-            "cn_buy",
-            "cn_sell",
-            "created_at",
-        ]
-        rbi_sql = _build_upsert_sql(
-            "forex_rates_rbi",
-            rbi_columns,
-            ["rate_date", "currency_code"],
-            rbi_updates,
-        )
-        sbi_sql = _build_upsert_sql(
-            "forex_rates_sbi",
-            sbi_columns,
-            ["rate_date", "currency_code"],
-            sbi_updates,
-        )
 
         rbi_rows: list[ForexRateRecord] = []
         sbi_rows: list[ForexRateRecord] = []
+        sbi_append = sbi_rows.append
+        rbi_append = rbi_rows.append
+        # Records normally carry an upper-case source, so most rows resolve with one
+        # dict lookup; anything else falls back to the normalised comparison.
+        appenders = {"SBI": sbi_append, "RBI": rbi_append}
         for row in rows:
-            if (row.source or "RBI").upper() == "SBI":
-                sbi_rows.append(row)
-            else:
-                rbi_rows.append(row)
-
-        def _postgres_bulk_upsert(
-            connection,
-            table: str,
-            columns: Sequence[str],
-            conflict: Sequence[str],
-            updates: Sequence[str],
-            params_list: Sequence[Mapping[str, object]],
-        ) -> bool:
-            try:  # pragma: no cover - optional dependency
-                from psycopg2.extras import execute_values
-            except ModuleNotFoundError:
-                return False
-            raw = getattr(connection, "connection", None)
-            if raw is None:
-                return False
-            values = [[params[column] for column in columns] for params in params_list]
-            if not values:
-                return True
-            columns_csv = ", ".join(columns)
-            conflict_csv = ", ".join(conflict)
-            update_csv = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates)
-            sql = (
-                f"INSERT INTO {table} ({columns_csv}) VALUES %s "
-                f"ON CONFLICT({conflict_csv}) DO UPDATE SET {update_csv}"
-            )
-            with raw.cursor() as cursor:
-                execute_values(cursor, sql, values)
-            return True
-
-        def _mysql_bulk_upsert(
-            connection,
-            table: str,
-            columns: Sequence[str],
-            updates: Sequence[str],
-            params_list: Sequence[Mapping[str, object]],
-        ) -> bool:
-            raw = getattr(connection, "connection", None)
-            if raw is None:
-                return False
-            if not params_list:
-                return True
-            placeholders = ", ".join(["%s"] * len(columns))
-            columns_csv = ", ".join(columns)
-            update_csv = ", ".join(f"{col} = VALUES({col})" for col in updates)
-            sql = (
-                f"INSERT INTO {table} ({columns_csv}) VALUES ({placeholders}) "
-                f"ON DUPLICATE KEY UPDATE {update_csv}"
-            )
-            values = [tuple(params[column] for column in columns) for params in params_list]
-            with raw.cursor() as cursor:
-                cursor.executemany(sql, values)
-            return True
-
+            append = appenders.get(row.source)
+            if append is None:
+                append = sbi_append if (row.source or "RBI").upper() == "SBI" else rbi_append
+            append(row)
+
+        # One timestamp per call, shared by every row tuple; it stays a datetime so
+        # each driver keeps binding it natively.
+        now = datetime.utcnow()
         with engine.begin() as connection:
             if rbi_rows:
-                now = datetime.utcnow()
-                rbi_params: list[dict[str, object]] = [
-                    {
-                        "rate_date": row.rate_date,
-                        "currency_code": row.currency,
-                        "rate": row.rate,
-                        "base_currency": "INR",
-                        "created_at": now,
-                    }
-                    for row in rbi_rows
+                rbi_values: list[tuple[object, ...]] = [
+                    (row.rate_date, row.currency, row.rate, "INR", now) for row in rbi_rows
                 ]
-                fast_inserted = False
-                if dialect == "postgresql":
-                    fast_inserted = _postgres_bulk_upsert(
-                        connection,
-                        "forex_rates_rbi",
-                        rbi_columns,
-                        ["rate_date", "currency_code"],
-                        rbi_updates,
-                        rbi_params,
-                    )
-                elif dialect in {"mysql", "mariadb"}:
-                    fast_inserted = _mysql_bulk_upsert(
-                        connection,
-                        "forex_rates_rbi",
-                        rbi_columns,
-                        rbi_updates,
-                        rbi_params,
-                    )
-                if not fast_inserted:
-                    if rbi_sql is None:
-                        for params in rbi_params:
-                            connection.execute(text(DELETE_RBI_SQL), params)
-                            connection.execute(text(INSERT_RBI_SQL), params)
-                    else:
-                        connection.execute(text(rbi_sql), rbi_params)
+                self._upsert_rows(
+                    connection,
+                    "forex_rates_rbi",
+                    RBI_COLUMNS,
+                    FOREX_CONFLICT_COLUMNS,
+                    RBI_UPDATES,
+                    rbi_values,
+                    DELETE_RBI_SQL,
+                    INSERT_RBI_SQL,
+                )
                 result.inserted += len(rbi_rows)
             if sbi_rows:
-                now = datetime.utcnow()
-                sbi_params: list[dict[str, object]] = [
-                    {
-                        "rate_date": row.rate_date,
-                        "currency_code": row.currency,
-                        "rate": row.rate,
-                        "base_currency": "INR",
-                        "tt_buy": row.tt_buy,
-                        "tt_sell": row.tt_sell,
-                        "bill_buy": row.bill_buy,
-                        "bill_sell": row.bill_sell,
-                        "travel_card_buy": row.travel_card_buy,
-                        "travel_card_sell": row.travel_card_sell,
-                        "cn_buy": row.cn_buy,
-                        "cn_sell": row.cn_sell,
-                        "created_at": now,
-                    }
+                sbi_values: list[tuple[object, ...]] = [
+                    (
+                        row.rate_date,
+                        row.currency,
+                        row.rate,
+                        "INR",
+                        row.tt_buy,
+                        row.tt_sell,
+                        row.bill_buy,
+                        row.bill_sell,
+                        row.travel_card_buy,
+                        row.travel_card_sell,
+                        row.cn_buy,
+                        row.cn_sell,
+                        now,
+                    )
                     for row in sbi_rows
                 ]
-                fast_inserted = False
-                if dialect == "postgresql":
-                    fast_inserted = _postgres_bulk_upsert(
-                        connection,
-                        "forex_rates_sbi",
-                        sbi_columns,
-                        ["rate_date", "currency_code"],
-                        sbi_updates,
-                        sbi_params,
-                    )
-                elif dialect in {"mysql", "mariadb"}:
-                    fast_inserted = _mysql_bulk_upsert(
-                        connection,
-                        "forex_rates_sbi",
-                        sbi_columns,
-                        sbi_updates,
-                        sbi_params,
-                    )
-                if not fast_inserted:
-                    if sbi_sql is None:
-                        for params in sbi_params:
-                            connection.execute(text(DELETE_SBI_SQL), params)
-                            connection.execute(text(INSERT_SBI_SQL), params)
-                    else:
-                        connection.execute(text(sbi_sql), sbi_params)
+                self._upsert_rows(
+                    connection,
+                    "forex_rates_sbi",
+                    SBI_COLUMNS,
+                    FOREX_CONFLICT_COLUMNS,
+                    SBI_UPDATES,
+                    sbi_values,
+                    DELETE_SBI_SQL,
+                    INSERT_SBI_SQL,
+                )
                 result.inserted += len(sbi_rows)
         return result
 
@@ -490,93 +536,26 @@ class RelationalBackend(BackendStrategy):
         result = PersistenceResult()
         if not rows:
             return result
-        _, insert_sql, delete_sql = self._resolve_lme_statements(metal)
+        normalised, insert_sql, delete_sql = self._resolve_lme_statements(metal)
         engine = self._get_engine()
         if text is None:  # pragma: no cover - defensive guard
             raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
-        dialect = engine.dialect.name
-        columns = ["rate_date", "price", "price_3_month", "stock", "created_at"]
-        updates = ["price", "price_3_month", "stock", "created_at"]
-
-        def _build_upsert_sql(table: str) -> str | None:
-            placeholders = ", ".join(f":{col}" for col in columns)
-            columns_csv = ", ".join(columns)
-            base = f"INSERT INTO {table}({columns_csv}) VALUES({placeholders})"
-            if dialect in {"postgresql", "sqlite"}:
-                update_csv = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates)
-                return f"{base} ON CONFLICT(rate_date) DO UPDATE SET {update_csv}"
-            if dialect in {"mysql", "mariadb"}:
-                update_csv = ", ".join(f"{col} = VALUES({col})" for col in updates)
-                return f"{base} ON DUPLICATE KEY UPDATE {update_csv}"
-            return None
-
-        table = "lme_copper_rates" if metal.upper() in {"CU", "COPPER"} else "lme_aluminum_rates"
-        upsert_sql = _build_upsert_sql(table)
-        params: list[dict[str, object]] = [
-            {
-                "rate_date": row.rate_date,
-                "price": row.price,
-                "price_3_month": row.price_3_month,
-                "stock": row.stock,
-                "created_at": datetime.utcnow(),
-            }
-            for row in rows
+        table = "lme_copper_rates" if normalised == "COPPER" else "lme_aluminum_rates"
+        now = datetime.utcnow()
+        values: list[tuple[object, ...]] = [
+            (row.rate_date, row.price, row.price_3_month, row.stock, now) for row in rows
         ]
-
-        def _postgres_bulk_upsert(
-            connection, table: str, columns: Sequence[str], updates: Sequence[str]
-        ) -> bool:
-            try:  # pragma: no cover - optional dependency
-                from psycopg2.extras import execute_values
-            except ModuleNotFoundError:
-                return False
-            raw = getattr(connection, "connection", None)
-            if raw is None:
-                return False
-            values = [[row[column] for column in columns] for row in params]
-            if not values:
-                return True
-            columns_csv = ", ".join(columns)
-            update_csv = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates)
-            sql = (
-                f"INSERT INTO {table} ({columns_csv}) VALUES %s "
-                f"ON CONFLICT(rate_date) DO UPDATE SET {update_csv}"
-            )
-            with raw.cursor() as cursor:
-                execute_values(cursor, sql, values)
-            return True
-
-        def _mysql_bulk_upsert(connection, table: str, columns: Sequence[str]) -> bool:
-            raw = getattr(connection, "connection", None)
-            if raw is None:
-                return False
-            if not params:
-                return True
-            placeholders = ", ".join(["%s"] * len(columns))
-            columns_csv = ", ".join(columns)
-            update_csv = ", ".join(f"{col} = VALUES({col})" for col in updates)
-            sql = (
-                f"INSERT INTO {table} ({columns_csv}) VALUES ({placeholders}) "
-                f"ON DUPLICATE KEY UPDATE {update_csv}"
-            )
-            values = [tuple(row[column] for column in columns) for row in params]
-            with raw.cursor() as cursor:
-                cursor.executemany(sql, values)
-            return True
-
         with engine.begin() as connection:
-            fast_inserted = False
-            if dialect == "postgresql":
-                fast_inserted = _postgres_bulk_upsert(connection, table, columns, updates)
-            elif dialect in {"mysql", "mariadb"}:
-                fast_inserted = _mysql_bulk_upsert(connection, table, columns)
-            if not fast_inserted:
-                if upsert_sql is None:
-                    for row_params in params:
-                        connection.execute(text(delete_sql), row_params)
-                        connection.execute(text(insert_sql), row_params)
-                else:
-                    connection.execute(text(upsert_sql), params)
+            self._upsert_rows(
+                connection,
+                table,
+                LME_COLUMNS,
+                LME_CONFLICT_COLUMNS,
+                LME_UPDATES,
+                values,
+                delete_sql,
+                insert_sql,
+            )
         result.inserted += len(rows)
         return result
 
@@ -584,51 +563,23 @@ class RelationalBackend(BackendStrategy):
         engine = self._get_engine()
         if text is None:  # pragma: no cover - defensive guard
             raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
+        checkpoint_sql = CHECKPOINT_UPSERT_SQL.get(self._get_dialect())
+        if checkpoint_sql is None:  # pragma: no cover - unknown dialect
+            return
+        params = {"source": source.upper(), "last_ingested_date": rate_date}
         with engine.begin() as connection:
-            dialect = connection.engine.dialect.name
-            params = {"source": source.upper(), "last_ingested_date": rate_date}
-            if dialect == "postgresql":
-                connection.execute(
-                    text(
-                        """
-                        INSERT INTO ingestion_metadata(source, last_ingested_date)
-                        VALUES(:source, :last_ingested_date)
-                        ON CONFLICT(source) DO UPDATE
-                        SET last_ingested_date = EXCLUDED.last_ingested_date
-                        WHERE EXCLUDED.last_ingested_date > ingestion_metadata.last_ingested_date
-                        """
-                    ),
-                    params,
-                )
-            elif dialect in {"mysql", "mariadb"}:
-                connection.execute(
-                    text(
-                        """
-                        INSERT INTO ingestion_metadata(source, last_ingested_date)
-                        VALUES(:source, :last_ingested_date)
-                        ON DUPLICATE KEY UPDATE
-                        last_ingested_date = IF(
-                            VALUES(last_ingested_date) > last_ingested_date,
-                            VALUES(last_ingested_date),
-                            last_ingested_date
-                        )
-                        """
-                    ),
-                    params,
-                )
-            elif dialect == "sqlite":
-                connection.execute(
-                    text(
-                        """
-                        INSERT INTO ingestion_metadata(source, last_ingested_date)
-                        VALUES(:source, :last_ingested_date)
-                        ON CONFLICT(source) DO UPDATE
-                        SET last_ingested_date = excluded.last_ingested_date
-                        WHERE excluded.last_ingested_date > ingestion_metadata.last_ingested_date
-                        """
-                    ),
-                    params,
-                )
+            connection.execute(_cached_text(checkpoint_sql), params)
+
+    def refresh_statistics(self) -> None:
+        """Run ``ANALYZE`` on the rate tables so the planner sees bulk-loaded rows."""
+
+        engine = self._get_engine()
+        if text is None:  # pragma: no cover - defensive guard
+            raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
+        keyword = "ANALYZE TABLE" if self._get_dialect() in {"mysql", "mariadb"} else "ANALYZE"
+        with engine.begin() as connection:
+            for table in ANALYZED_TABLES:
+                connection.execute(_cached_text(f"{keyword} {table}"))
 
     def fetch_range(
         self,
@@ -637,11 +588,75 @@ class RelationalBackend(BackendStrategy):
         *,
         source: str | None = None,
     ) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(start, end, source=source)
+
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        return self._iter_forex_batches(start, end, source=source, batch_size=batch_size)
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        dialect = self._get_dialect()
+        bucket_sql = PERIOD_BUCKET_SQL.get(dialect, {}).get(frequency.lower())
+        if bucket_sql is None:
+            msg = f"Period aggregation for {frequency!r} not supported on dialect {dialect}"
+            raise NotImplementedError(msg)
+        return self._fetch_forex_rows(start, end, source=source, bucket_sql=bucket_sql)
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(None, None, source=source, latest_only=True)
+
+    def _fetch_forex_rows(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+        bucket_sql: str | None = None,
+        latest_only: bool = False,
+    ) -> list[ForexRateRecord]:
+        records: list[ForexRateRecord] = []
+        for batch in self._iter_forex_batches(
+            start, end, source=source, bucket_sql=bucket_sql, latest_only=latest_only
+        ):
+            records.extend(batch)
+        return records
+
+    def _iter_forex_batches(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+        batch_size: int | None = None,
+        bucket_sql: str | None = None,
+        latest_only: bool = False,
+    ) -> Iterator[list[ForexRateRecord]]:
         engine = self._get_engine()
         if text is None:  # pragma: no cover - defensive guard
             raise ModuleNotFoundError("SQLAlchemy is required for relational backends")
 
-        def _build_query(table: str) -> tuple[str, dict[str, object]]:
+        dialect = self._get_dialect()
+
+        def _build_query(table: str, columns: str) -> tuple[str, dict[str, object]]:
+            if latest_only:
+                # MAX(rate_date) is answered from the (rate_date, currency_code) key.
+                latest_filter = f"rate_date = (SELECT MAX(rate_date) FROM {table})"
+                return f"SELECT {columns} FROM {table} WHERE {latest_filter}", {}
             where_clauses: list[str] = []
             params: dict[str, object] = {}
             if start is not None:
@@ -650,50 +665,57 @@ class RelationalBackend(BackendStrategy):
             if end is not None:
                 where_clauses.append("rate_date <= :end_date")
                 params["end_date"] = end
-            query = f"SELECT * FROM {table} ORDER BY rate_date"
+            if bucket_sql is not None:
+                range_filter = ""
+                if where_clauses:
+                    range_filter = " WHERE " + " AND ".join(where_clauses)
+                # Keep only the last available date of every period bucket.
+                where_clauses.append(
+                    f"rate_date IN (SELECT MAX(rate_date) FROM {table}{range_filter} "
+                    f"GROUP BY {bucket_sql})"
+                )
+            query = f"SELECT {columns} FROM {table} ORDER BY rate_date"
             if where_clauses:
                 query = (
-                    f"SELECT * FROM {table} WHERE "
+                    f"SELECT {columns} FROM {table} WHERE "
                     + " AND ".join(where_clauses)
                     + " ORDER BY rate_date"
                 )
             return query, params
 
-        records: list[ForexRateRecord] = []
         with engine.connect() as connection:
+            if batch_size is not None:
+                # stream_results opens a server-side cursor (psycopg2 named cursor,
+                # MySQL SSCursor) so only one partition is buffered at a time.
+                connection = connection.execution_options(stream_results=True)
+
+            def _partitions(
+                table: str, columns: tuple[str, ...], float_columns: tuple[str, ...]
+            ) -> Iterator[Sequence[Any]]:
+                query, params = _build_query(table, _select_list(dialect, columns, float_columns))
+                result = connection.execute(_forex_select(query, float_columns), params)
+                if batch_size is None:
+                    return iter((result.all(),))
+                return result.partitions(batch_size)
+
             if source is None or source.upper() == "SBI":
-                query, params = _build_query("forex_rates_sbi")
-                for row in connection.execute(text(query), params):
-                    mapping = row._mapping
-                    records.append(
+                for partition in _partitions(
+                    "forex_rates_sbi", SBI_SELECT_COLUMNS, SBI_FLOAT_COLUMNS
+                ):
+                    yield [
                         ForexRateRecord(
-                            rate_date=_normalise_rate_date(mapping["rate_date"]),
-                            currency=mapping["currency_code"],
-                            rate=float(mapping["rate"]),
-                            source="SBI",
-                            tt_buy=mapping["tt_buy"],
-                            tt_sell=mapping["tt_sell"],
-                            bill_buy=mapping["bill_buy"],
-                            bill_sell=mapping["bill_sell"],
-                            travel_card_buy=mapping["travel_card_buy"],
-                            travel_card_sell=mapping["travel_card_sell"],
-                            cn_buy=mapping["cn_buy"],
-                            cn_sell=mapping["cn_sell"],
+                            _normalise_rate_date(rate_date), currency, rate, "SBI", *sbi_fields
                         )
-                    )
+                        for rate_date, currency, rate, *sbi_fields in partition
+                    ]
             if source is None or source.upper() == "RBI":
-                query, params = _build_query("forex_rates_rbi")
-                for row in connection.execute(text(query), params):
-                    mapping = row._mapping
-                    records.append(
-                        ForexRateRecord(
-                            rate_date=_normalise_rate_date(mapping["rate_date"]),
-                            currency=mapping["currency_code"],
-                            rate=float(mapping["rate"]),
-                            source="RBI",
-                        )
-                    )
-        return records
+                for partition in _partitions(
+                    "forex_rates_rbi", RBI_SELECT_COLUMNS, RBI_FLOAT_COLUMNS
+                ):
+                    yield [
+                        ForexRateRecord(_normalise_rate_date(rate_date), currency, rate, "RBI")
+                        for rate_date, currency, rate in partition
+                    ]
 
     def fetch_lme_range(
         self, metal: str, start: date | None = None, end: date | None = None
@@ -723,7 +745,7 @@ class RelationalBackend(BackendStrategy):
         query, params = _build_query()
         records: list[LmeRateRecord] = []
         with engine.connect() as connection:
-            for row in connection.execute(text(query), params):
+            for row in connection.execute(_cached_text(query), params):
                 mapping = row._mapping
                 stock_value = casting_float(mapping.get("stock"))
                 records.append(
@@ -759,4 +781,121 @@ def casting_float(value: object | None) -> float | None:
         return None
 
 
+@lru_cache(maxsize=None)
+def _cached_text(sql: str) -> Any:
+    """Return a shared ``TextClause`` for ``sql`` so bind parsing happens once per string."""
+
+    return text(sql)
+
+
+@lru_cache(maxsize=None)
+def _select_list(dialect: str, columns: tuple[str, ...], float_columns: tuple[str, ...]) -> str:
+    if dialect != "sqlite":
+        return ", ".join(columns)
+    # NUMERIC affinity stores whole numbers as INTEGER, which Float does not
+    # convert on SQLite; cast server-side so rows still carry floats.
+    return ", ".join(
+        f"CAST({column} AS REAL) AS {column}" if column in float_columns else column
+        for column in columns
+    )
+
+
+@lru_cache(maxsize=None)
+def _forex_select(sql: str, float_columns: tuple[str, ...]) -> Any:
+    """Return a shared textual SELECT that converts ``float_columns`` to ``float``."""
+
+    return text(sql).columns(**{name: Float() for name in float_columns})
+
+
+@lru_cache(maxsize=None)
+def _build_upsert_sql(
+    dialect: str,
+    table: str,
+    columns: tuple[str, ...],
+    conflict: tuple[str, ...],
+    updates: tuple[str, ...],
+) -> str | None:
+    placeholders = ", ".join(f":{col}" for col in columns)
+    columns_csv = ", ".join(columns)
+    base = f"INSERT INTO {table}({columns_csv}) VALUES({placeholders})"
+    if dialect in {"postgresql", "sqlite"}:
+        update_csv = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates)
+        conflict_csv = ", ".join(conflict)
+        return f"{base} ON CONFLICT({conflict_csv}) DO UPDATE SET {update_csv}"
+    if dialect in {"mysql", "mariadb"}:
+        update_csv = ", ".join(f"{col} = VALUES({col})" for col in updates)
+        return f"{base} ON DUPLICATE KEY UPDATE {update_csv}"
+    return None
+
+
+@lru_cache(maxsize=None)
+def _postgres_values_sql(
+    table: str, columns: tuple[str, ...], conflict: tuple[str, ...], updates: tuple[str, ...]
+) -> str:
+    columns_csv = ", ".join(columns)
+    conflict_csv = ", ".join(conflict)
+    update_csv = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates)
+    return (
+        f"INSERT INTO {table} ({columns_csv}) VALUES %s "
+        f"ON CONFLICT({conflict_csv}) DO UPDATE SET {update_csv}"
+    )
+
+
+@lru_cache(maxsize=None)
+def _mysql_values_sql(table: str, columns: tuple[str, ...], updates: tuple[str, ...]) -> str:
+    placeholders = ", ".join(["%s"] * len(columns))
+    columns_csv = ", ".join(columns)
+    update_csv = ", ".join(f"{col} = VALUES({col})" for col in updates)
+    return (
+        f"INSERT INTO {table} ({columns_csv}) VALUES ({placeholders}) "
+        f"ON DUPLICATE KEY UPDATE {update_csv}"
+    )
+
+
+def _postgres_bulk_upsert(
+    connection,
+    table: str,
+    columns: tuple[str, ...],
+    conflict: tuple[str, ...],
+    updates: tuple[str, ...],
+    values: list[tuple[object, ...]],
+) -> bool:
+    try:  # pragma: no cover - optional dependency
+        from psycopg2.extras import execute_values
+    except ModuleNotFoundError:
+        return False
+    raw = getattr(connection, "connection", None)
+    if raw is None:
+        return False
+    if not values:
+        return True
+    sql = _postgres_values_sql(table, columns, conflict, updates)
+    with raw.cursor() as cursor:
+        # The default page_size of 100 would split a chunk into many round trips;
+        # larger pages are still capped so unbounded callers get several statements.
+        page_size = min(len(values), BULK_STATEMENT_ROWS["postgresql"])
+        execute_values(cursor, sql, values, page_size=page_size)
+    return True
+
+
+def _mysql_bulk_upsert(
+    connection,
+    table: str,
+    columns: tuple[str, ...],
+    updates: tuple[str, ...],
+    values: list[tuple[object, ...]],
+) -> bool:
+    raw = getattr(connection, "connection", None)
+    if raw is None:
+        return False
+    if not values:
+        return True
+    sql = _mysql_values_sql(table, columns, updates)
+    batch_size = BULK_STATEMENT_ROWS["mysql"]
+    with raw.cursor() as cursor:
+        for start in range(0, len(values), batch_size):
+            cursor.executemany(sql, values[start : start + batch_size])
+    return True
+
+
 __all__ = ["RelationalBackend"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
-from typing import Sequence
+from typing import Iterator, Sequence
 
 from fx_bharat.db import DEFAULT_SQLITE_DB_PATH
 from fx_bharat.db.base_backend import BackendStrategy
@@ -41,6 +41,29 @@ class SQLiteBackend(BackendStrategy):
     ) -> list[ForexRateRecord]:
         return self.manager.fetch_range(start, end, source=source)
 
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        return self.manager.fetch_range_iter(start, end, source=source, batch_size=batch_size)
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        return self.manager.fetch_period_end_range(start, end, source=source, frequency=frequency)
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        return self.manager.fetch_latest(source=source)
+
     def insert_lme_rates(self, metal: str, rows: Sequence[LmeRateRecord]) -> PersistenceResult:
         return self.manager.insert_lme_rates(metal, rows)
 
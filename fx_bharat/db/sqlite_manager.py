@@ -5,8 +5,9 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, Sequence, cast
+from typing import TYPE_CHECKING, Any, Iterator, Protocol, Sequence, cast
 
 from fx_bharat.db import DEFAULT_SQLITE_DB_PATH
 from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
@@ -15,7 +16,18 @@ from fx_bharat.utils.logger import get_logger
 LOGGER = get_logger(__name__)
 
 try:  # pragma: no cover - exercised indirectly
-    from sqlalchemy import Column, Date, DateTime, Float, String, create_engine, select, text
+    from sqlalchemy import (
+        Column,
+        Date,
+        DateTime,
+        Float,
+        String,
+        bindparam,
+        create_engine,
+        event,
+        select,
+        text,
+    )
     from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
     from sqlalchemy.sql import func
 except ModuleNotFoundError:  # pragma: no cover - fallback path
@@ -134,6 +146,39 @@ CREATE TABLE IF NOT EXISTS lme_aluminum_rates (
 );
 """
 
+# Column order mirrors ForexRateRecord so rows unpack positionally (``source`` is set per table).
+RBI_RATE_COLUMNS = ("rate_date", "currency", "rate")
+SBI_RATE_COLUMNS = (
+    *RBI_RATE_COLUMNS,
+    "tt_buy",
+    "tt_sell",
+    "bill_buy",
+    "bill_sell",
+    "travel_card_buy",
+    "travel_card_sell",
+    "cn_buy",
+    "cn_sell",
+)
+
+# Per-connection tuning for read-heavy workloads. None of these settings are
+# persisted in the database file, so the bundled forex.db is left untouched
+# (journal_mode=WAL would be written into the file and is deliberately omitted).
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def _apply_connection_pragmas(dbapi_connection: Any, *_: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 INSERT_RBI_IGNORE_STATEMENT = """
 INSERT OR IGNORE INTO forex_rates_rbi(rate_date, currency, rate)
 VALUES(?, ?, ?);
@@ -223,6 +268,29 @@ class _BackendProtocol(Protocol):
     ) -> list[ForexRateRecord]:
         ...  # pragma: no cover - protocol definition
 
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        ...  # pragma: no cover - protocol definition
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        ...  # pragma: no cover - protocol definition
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        ...  # pragma: no cover - protocol definition
+
     def close(self) -> None:
         ...  # pragma: no cover - protocol definition
 
@@ -257,6 +325,7 @@ class _SQLAlchemyBackend:
             future=True,
             connect_args={"check_same_thread": False},
         )
+        event.listen(self.engine, "connect", _apply_connection_pragmas)
         Base.metadata.create_all(self.engine)
         self._ensure_lme_schema()
         self._SessionFactory: sessionmaker[Session] = sessionmaker(
@@ -423,49 +492,121 @@ class _SQLAlchemyBackend:
         end: date | None = None,
         *,
         source: str | None = None,
+    ) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(start, end, source=source)
+
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        shape = (start is not None, end is not None, None, False, False)
+        params = {"start": start, "end": end}
+        with self.engine.connect() as connection:
+            # ``yield_per`` keeps sqlite3 stepping the cursor instead of buffering
+            # the whole result, so only one partition is alive at a time.
+            streaming = connection.execution_options(yield_per=batch_size)
+            if source is None or source.upper() == "SBI":
+                sbi_stmt = self._range_statement(_SbiRate, SBI_RATE_COLUMNS, *shape)
+                for partition in streaming.execute(sbi_stmt, params).partitions():
+                    yield [
+                        ForexRateRecord(rate_date, currency, rate, "SBI", *sbi_fields)
+                        for rate_date, currency, rate, *sbi_fields in partition
+                    ]
+            if source is None or source.upper() == "RBI":
+                rbi_stmt = self._range_statement(_RbiRate, RBI_RATE_COLUMNS, *shape)
+                for partition in streaming.execute(rbi_stmt, params).partitions():
+                    yield [
+                        ForexRateRecord(rate_date, currency, rate, "RBI")
+                        for rate_date, currency, rate in partition
+                    ]
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(
+            start, end, source=source, period_prefix=_resolve_period_prefix(frequency)
+        )
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(None, None, source=source, latest_only=True)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _range_statement(
+        model: Any,
+        columns: tuple[str, ...],
+        has_start: bool,
+        has_end: bool,
+        period_prefix: int | None,
+        latest_only: bool = False,
+        single_day: bool = False,
+    ) -> Any:
+        # Statements only depend on the query shape, so they are built once with
+        # ``:start``/``:end`` bind parameters and re-executed with new dates. That
+        # keeps SQLAlchemy's compiled cache and sqlite3's statement cache warm for
+        # the common ``rate()`` lookups.
+        # Select plain columns instead of ORM entities so rows skip identity-map
+        # bookkeeping and can be unpacked straight into ForexRateRecord.
+        stmt = select(*(getattr(model, column) for column in columns))
+        if latest_only:
+            latest_date = select(func.max(model.rate_date)).scalar_subquery()
+            return stmt.where(model.rate_date == latest_date)
+        if single_day:
+            return stmt.where(model.rate_date == bindparam("start"))
+
+        def _constrain(query: Any) -> Any:
+            if has_start:
+                query = query.where(model.rate_date >= bindparam("start"))
+            if has_end:
+                query = query.where(model.rate_date <= bindparam("end"))
+            return query
+
+        stmt = _constrain(stmt.order_by(model.rate_date))
+        if period_prefix is not None:
+            latest_per_period = _constrain(select(func.max(model.rate_date))).group_by(
+                func.substr(model.rate_date, 1, period_prefix)
+            )
+            stmt = stmt.where(model.rate_date.in_(latest_per_period))
+        return stmt
+
+    def _fetch_forex_rows(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+        period_prefix: int | None = None,
+        latest_only: bool = False,
     ) -> list[ForexRateRecord]:
         records: list[ForexRateRecord] = []
-        with self._SessionFactory() as session:
+        shape = (
+            start is not None,
+            end is not None,
+            period_prefix,
+            latest_only,
+            start is not None and start == end and period_prefix is None,
+        )
+        params = {"start": start, "end": end}
+        with self.engine.connect() as connection:
             if source is None or source.upper() == "SBI":
-                sbi_stmt = select(_SbiRate).order_by(_SbiRate.rate_date)
-                if start is not None:
-                    sbi_stmt = sbi_stmt.where(_SbiRate.rate_date >= start)
-                if end is not None:
-                    sbi_stmt = sbi_stmt.where(_SbiRate.rate_date <= end)
-                for sbi_row in session.execute(sbi_stmt).scalars():
-                    sbi_model = cast(_SbiRate, sbi_row)
-                    records.append(
-                        ForexRateRecord(
-                            rate_date=cast(date, sbi_model.rate_date),
-                            currency=cast(str, sbi_model.currency),
-                            rate=cast(float, sbi_model.rate),
-                            source="SBI",
-                            tt_buy=cast(float | None, sbi_model.tt_buy),
-                            tt_sell=cast(float | None, sbi_model.tt_sell),
-                            bill_buy=cast(float | None, sbi_model.bill_buy),
-                            bill_sell=cast(float | None, sbi_model.bill_sell),
-                            travel_card_buy=cast(float | None, sbi_model.travel_card_buy),
-                            travel_card_sell=cast(float | None, sbi_model.travel_card_sell),
-                            cn_buy=cast(float | None, sbi_model.cn_buy),
-                            cn_sell=cast(float | None, sbi_model.cn_sell),
-                        )
-                    )
-        if source is None or source.upper() == "RBI":
-            rbi_stmt = select(_RbiRate).order_by(_RbiRate.rate_date)
-            if start is not None:
-                rbi_stmt = rbi_stmt.where(_RbiRate.rate_date >= start)
-            if end is not None:
-                rbi_stmt = rbi_stmt.where(_RbiRate.rate_date <= end)
-            for rbi_row in session.execute(rbi_stmt).scalars():
-                rbi_model = cast(_RbiRate, rbi_row)
-                records.append(
-                    ForexRateRecord(
-                        rate_date=cast(date, rbi_model.rate_date),
-                        currency=cast(str, rbi_model.currency),
-                        rate=cast(float, rbi_model.rate),
-                        source="RBI",
-                    )
-                )
+                sbi_stmt = self._range_statement(_SbiRate, SBI_RATE_COLUMNS, *shape)
+                for rate_date, currency, rate, *sbi_fields in connection.execute(
+                    sbi_stmt, params
+                ):
+                    records.append(ForexRateRecord(rate_date, currency, rate, "SBI", *sbi_fields))
+            if source is None or source.upper() == "RBI":
+                rbi_stmt = self._range_statement(_RbiRate, RBI_RATE_COLUMNS, *shape)
+                for rate_date, currency, rate in connection.execute(rbi_stmt, params):
+                    records.append(ForexRateRecord(rate_date, currency, rate, "RBI"))
         return records
 
     def fetch_lme_range(
@@ -527,6 +668,7 @@ class _SQLiteFallbackBackend:
     def __init__(self, db_path: str | Path) -> None:
         self.db_path = Path(db_path)
         self._connection = sqlite3.connect(self.db_path)
+        _apply_connection_pragmas(self._connection)
         self._connection.execute("PRAGMA foreign_keys = ON")
         self._connection.row_factory = sqlite3.Row
         self._connection.executescript(SCHEMA)
@@ -684,57 +826,125 @@ class _SQLiteFallbackBackend:
         *,
         source: str | None = None,
     ) -> list[ForexRateRecord]:
-        def _build_query(table: str) -> tuple[str, list[str]]:
-            clauses: list[str] = []
-            params: list[str] = []
-            if start is not None:
-                clauses.append("rate_date >= ?")
-                params.append(start.isoformat())
-            if end is not None:
-                clauses.append("rate_date <= ?")
-                params.append(end.isoformat())
-            where = ""
-            if clauses:
-                where = " WHERE " + " AND ".join(clauses)
-            return (
-                f"SELECT * FROM {table}{where} ORDER BY rate_date",
-                params,
-            )
+        return self._fetch_forex_rows(start, end, source=source)
 
-        records: list[ForexRateRecord] = []
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(
+            start, end, source=source, period_prefix=_resolve_period_prefix(frequency)
+        )
 
-        if source is None or source.upper() == "SBI":
-            query, params = _build_query("forex_rates_sbi")
-            for row in self._connection.execute(query, params).fetchall():
-                records.append(
-                    ForexRateRecord(
-                        rate_date=date.fromisoformat(row["rate_date"]),
-                        currency=row["currency"],
-                        rate=row["rate"],
-                        source="SBI",
-                        tt_buy=row["tt_buy"],
-                        tt_sell=row["tt_sell"],
-                        bill_buy=row["bill_buy"],
-                        bill_sell=row["bill_sell"],
-                        travel_card_buy=row["travel_card_buy"],
-                        travel_card_sell=row["travel_card_sell"],
-                        cn_buy=row["cn_buy"],
-                        cn_sell=row["cn_sell"],
-                    )
-                )
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        return self._fetch_forex_rows(None, None, source=source, latest_only=True)
 
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        for table, label in self._forex_tables(source):
+            query, params = self._build_forex_query(table, start, end)
+            cursor = self._connection.execute(query, params)
+            try:
+                while batch := cursor.fetchmany(batch_size):
+                    yield [self._forex_record(row, label) for row in batch]
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _forex_tables(source: str | None) -> list[tuple[str, str]]:
+        tables: list[tuple[str, str]] = []
+        if source is None or source.upper() == "SBI":
+            tables.append(("forex_rates_sbi", "SBI"))
         if source is None or source.upper() == "RBI":
-            query, params = _build_query("forex_rates_rbi")
-            for row in self._connection.execute(query, params).fetchall():
-                records.append(
-                    ForexRateRecord(
-                        rate_date=date.fromisoformat(row["rate_date"]),
-                        currency=row["currency"],
-                        rate=row["rate"],
-                        source="RBI",
-                    )
-                )
+            tables.append(("forex_rates_rbi", "RBI"))
+        return tables
 
+    @staticmethod
+    def _build_forex_query(
+        table: str,
+        start: date | None,
+        end: date | None,
+        period_prefix: int | None = None,
+        latest_only: bool = False,
+    ) -> tuple[str, list[object]]:
+        if latest_only:
+            # MAX(rate_date) is answered from the primary key index.
+            return (
+                f"SELECT * FROM {table} WHERE rate_date = (SELECT MAX(rate_date) FROM {table})",
+                [],
+            )
+        clauses: list[str] = []
+        params: list[object] = []
+        if start is not None:
+            clauses.append("rate_date >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("rate_date <= ?")
+            params.append(end.isoformat())
+        where = ""
+        if clauses:
+            where = " WHERE " + " AND ".join(clauses)
+        if period_prefix is not None:
+            # Keep only the last available date of every period bucket.
+            period_clause = (
+                f"rate_date IN (SELECT MAX(rate_date) FROM {table}{where} "
+                "GROUP BY substr(rate_date, 1, ?))"
+            )
+            params = [*params, *params, period_prefix]
+            where = f"{where} AND {period_clause}" if where else f" WHERE {period_clause}"
+        return (
+            f"SELECT * FROM {table}{where} ORDER BY rate_date",
+            params,
+        )
+
+    @staticmethod
+    def _forex_record(row: sqlite3.Row, source: str) -> ForexRateRecord:
+        if source == "SBI":
+            return ForexRateRecord(
+                rate_date=date.fromisoformat(row["rate_date"]),
+                currency=row["currency"],
+                rate=row["rate"],
+                source="SBI",
+                tt_buy=row["tt_buy"],
+                tt_sell=row["tt_sell"],
+                bill_buy=row["bill_buy"],
+                bill_sell=row["bill_sell"],
+                travel_card_buy=row["travel_card_buy"],
+                travel_card_sell=row["travel_card_sell"],
+                cn_buy=row["cn_buy"],
+                cn_sell=row["cn_sell"],
+            )
+        return ForexRateRecord(
+            rate_date=date.fromisoformat(row["rate_date"]),
+            currency=row["currency"],
+            rate=row["rate"],
+            source="RBI",
+        )
+
+    def _fetch_forex_rows(
+        self,
+        start: date | None,
+        end: date | None,
+        *,
+        source: str | None,
+        period_prefix: int | None = None,
+        latest_only: bool = False,
+    ) -> list[ForexRateRecord]:
+        records: list[ForexRateRecord] = []
+        for table, label in self._forex_tables(source):
+            query, params = self._build_forex_query(table, start, end, period_prefix, latest_only)
+            for row in self._connection.execute(query, params).fetchall():
+                records.append(self._forex_record(row, label))
         return records
 
     def fetch_lme_range(
@@ -837,6 +1047,39 @@ class SQLiteManager:
     ) -> list[ForexRateRecord]:
         return self._backend.fetch_range(start, end, source=source)
 
+    def fetch_range_iter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[ForexRateRecord]]:
+        """Yield rates in lists of at most ``batch_size`` rows without loading the range."""
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        return self._backend.fetch_range_iter(start, end, source=source, batch_size=batch_size)
+
+    def fetch_period_end_range(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        source: str | None = None,
+        frequency: str,
+    ) -> list[ForexRateRecord]:
+        """Return rates for the last available date of each monthly/yearly bucket."""
+
+        return self._backend.fetch_period_end_range(
+            start, end, source=source, frequency=frequency
+        )
+
+    def fetch_latest(self, *, source: str | None = None) -> list[ForexRateRecord]:
+        """Return the rates published on the most recent date of each source."""
+
+        return self._backend.fetch_latest(source=source)
+
     def insert_lme_rates(self, metal: str, rows: Sequence[LmeRateRecord]) -> PersistenceResult:
         result = self._backend.insert_lme_rates(metal, rows)
         LOGGER.info(
@@ -877,6 +1120,18 @@ class SQLiteManager:
         self.close()
 
 
+# ``rate_date`` is stored as ISO ``YYYY-MM-DD`` text, so the month/year bucket is
+# a plain prefix. ``substr`` avoids the date parsing ``strftime`` does per row.
+_PERIOD_PREFIX_LENGTHS = {"monthly": 7, "yearly": 4}
+
+
+def _resolve_period_prefix(frequency: str) -> int:
+    try:
+        return _PERIOD_PREFIX_LENGTHS[frequency.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported period frequency: {frequency}") from None
+
+
 def _normalise_lme_metal(metal: str) -> str:
     upper = metal.upper()
     if upper in {"CU", "COPPER"}:
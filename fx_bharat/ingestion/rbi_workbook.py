@@ -109,14 +109,14 @@ class RBIWorkbookConverter:
         working = working.dropna(how="all", subset=list(RATE_COLUMNS))
         working = working.sort_values("Date")
 
-        rows: list[list[str]] = []
-        for _, row in working.iterrows():
-            formatted_row = [row["Date"].strftime(self.date_format)]
-            formatted_row.extend(
-                "" if _pd.isna(row[column]) else f"{row[column]}" for column in RATE_COLUMNS
-            )
-            rows.append(formatted_row)
-        return rows
+        # Format whole columns at once and zip them back into rows; this avoids
+        # building a pandas Series per row via ``iterrows`` on multi-year workbooks.
+        formatted_columns = [working["Date"].dt.strftime(self.date_format)]
+        formatted_columns.extend(
+            working[column].astype(str).where(working[column].notna(), "")
+            for column in RATE_COLUMNS
+        )
+        return [list(row) for row in zip(*formatted_columns)]
 
     def _read_html_rows(self, path: Path) -> list[list[str]]:
         parser = _HTMLTableParser()
@@ -40,6 +40,8 @@ from fx_bharat.utils.logger import get_logger
 LOGGER = get_logger(__name__)
 
 SBI_FOREX_PDF_URL = "https://sbi.bank.in/documents/16012/1400784/FOREX_CARD_RATES.pdf"
+# Bump whenever parsing output changes so on-disk parse caches are invalidated.
+SBI_PDF_PARSER_VERSION = 1
 
 
 @dataclass(slots=True)
@@ -48,6 +50,7 @@ class SBIPDFParseResult:
 
     rate_date: date
     rates: list[ForexRateRecord]
+    document_date: date | None = None
 
 
 class SBIPDFParser:
@@ -81,9 +84,10 @@ class SBIPDFParser:
 
     def parse(self, pdf_path: str | Path, *, rate_date: date | None = None) -> SBIPDFParseResult:
         text = self._extract_text(Path(pdf_path))
-        resolved_date = rate_date or self._infer_date(text, pdf_path)
+        document_date = None if rate_date else self._document_date(text, pdf_path)
+        resolved_date = rate_date or document_date or infer_date_from_path(pdf_path)
         rows = list(self._extract_rates(text, resolved_date))
-        return SBIPDFParseResult(rate_date=resolved_date, rates=rows)
+        return SBIPDFParseResult(rate_date=resolved_date, rates=rows, document_date=document_date)
 
     def _extract_text(self, path: Path) -> str:
         try:
@@ -127,6 +131,9 @@ class SBIPDFParser:
             raise
 
     def _infer_date(self, text: str, pdf_path: str | Path) -> date:
+        return self._document_date(text, pdf_path) or infer_date_from_path(pdf_path)
+
+    def _document_date(self, text: str, pdf_path: str | Path) -> date | None:
         for idx, pattern in enumerate(self._DATE_PATTERNS):
             match = pattern.search(text.upper())
             if not match:
@@ -155,11 +162,7 @@ class SBIPDFParser:
             except ValueError:
                 LOGGER.warning("Ignoring invalid date %s in %s", match.group(0), pdf_path)
                 continue
-        try:
-            return date.fromisoformat(Path(pdf_path).stem)
-        except ValueError:
-            LOGGER.warning("Falling back to UTC date for %s", pdf_path)
-            return datetime.utcnow().date()
+        return None
 
     def _extract_rates(self, text: str, rate_date: date) -> Iterable[ForexRateRecord]:
         cleaned_text = re.sub(r"[,\t]+", " ", text.upper())
@@ -252,6 +255,16 @@ class SBIPDFParser:
             seen.add(code)
 
 
+def infer_date_from_path(pdf_path: str | Path) -> date:
+    """Return the date named by ``pdf_path`` (``YYYY-MM-DD.pdf``), else today's UTC date."""
+
+    try:
+        return date.fromisoformat(Path(pdf_path).stem)
+    except ValueError:
+        LOGGER.warning("Falling back to UTC date for %s", pdf_path)
+        return datetime.utcnow().date()
+
+
 class SBIPDFDownloader:
     """Download the latest SBI forex PDF from the public endpoint."""
 
@@ -285,4 +298,11 @@ class SBIPDFDownloader:
         return destination_path
 
 
-__all__ = ["SBI_FOREX_PDF_URL", "SBIPDFDownloader", "SBIPDFParser", "SBIPDFParseResult"]
+__all__ = [
+    "SBI_FOREX_PDF_URL",
+    "SBI_PDF_PARSER_VERSION",
+    "SBIPDFDownloader",
+    "SBIPDFParser",
+    "SBIPDFParseResult",
+    "infer_date_from_path",
+]
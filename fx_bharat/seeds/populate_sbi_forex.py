@@ -3,17 +3,31 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import tempfile
+from dataclasses import asdict
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 from fx_bharat.db import DEFAULT_SQLITE_DB_PATH
 from fx_bharat.db.sqlite_manager import PersistenceResult, SQLiteManager
-from fx_bharat.ingestion.sbi_pdf import SBIPDFDownloader, SBIPDFParser
+from fx_bharat.ingestion.models import ForexRateRecord
+from fx_bharat.ingestion.sbi_pdf import (
+    SBI_PDF_PARSER_VERSION,
+    SBIPDFDownloader,
+    SBIPDFParser,
+    SBIPDFParseResult,
+    infer_date_from_path,
+)
 from fx_bharat.utils.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Bump when the layout of cached parse entries changes.
+_PARSE_CACHE_FORMAT = 2
+
 __all__ = ["seed_sbi_forex", "seed_sbi_historical", "seed_sbi_today", "parse_args", "main"]
 
 
@@ -55,6 +69,11 @@ def parse_args() -> argparse.Namespace:
         help="Do not fetch the latest PDF from SBI before inserting",
     )
     parser.set_defaults(download=False)
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        help="Optional directory used to cache parsed PDFs by content hash",
+    )
     return parser.parse_args()
 
 
@@ -73,6 +92,63 @@ def _iter_pdf_paths(resource_dir: Path, start: date | None, end: date | None) ->
         yield path
 
 
+def _cached_parser(parser: SBIPDFParser, cache_dir: Path) -> Callable[[Path], SBIPDFParseResult]:
+    """Wrap ``parser.parse`` with a JSON cache keyed by the SHA-256 of each PDF.
+
+    Entries hold only what the PDF content determines: the date printed in the
+    document (if any) and the rate rows. The rate date is resolved from each path
+    on a cache hit, so identical PDFs filed under different dates stay distinct.
+    """
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _parse(pdf_path: Path) -> SBIPDFParseResult:
+        digest = hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+        cache_path = cache_dir / f"{digest}.p{SBI_PDF_PARSER_VERSION}.c{_PARSE_CACHE_FORMAT}.json"
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            document_date = payload["document_date"]
+            rate_date = (
+                date.fromisoformat(document_date)
+                if document_date
+                else infer_date_from_path(pdf_path)
+            )
+            return SBIPDFParseResult(
+                rate_date=rate_date,
+                rates=[ForexRateRecord(rate_date=rate_date, **row) for row in payload["rates"]],
+                document_date=date.fromisoformat(document_date) if document_date else None,
+            )
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning("Ignoring unreadable SBI parse cache %s (%s)", cache_path, exc)
+        parsed = parser.parse(pdf_path)
+        document_date = parsed.document_date
+        payload = {
+            "document_date": document_date.isoformat() if document_date else None,
+            "rates": [
+                {key: value for key, value in asdict(row).items() if key != "rate_date"}
+                for row in parsed.rates
+            ],
+        }
+        # A unique temp file per writer keeps concurrent seeds of identical PDFs
+        # from clobbering each other's half-written entries.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+        ) as handle:
+            json.dump(payload, handle)
+        temp_path = Path(handle.name)
+        try:
+            temp_path.replace(cache_path)
+        except OSError as exc:
+            # Losing the race to another writer is harmless: the entry is identical.
+            LOGGER.debug("Discarding SBI parse cache write for %s (%s)", cache_path, exc)
+            temp_path.unlink(missing_ok=True)
+        return parsed
+
+    return _parse
+
+
 def seed_sbi_historical(
     *,
     db_path: str | Path = DEFAULT_SQLITE_DB_PATH,
@@ -82,11 +158,14 @@ def seed_sbi_historical(
     download: bool = True,
     incremental: bool = True,
     dry_run: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> PersistenceResult:
     """Backfill SBI forex data from PDFs and optionally fetch the latest copy.
 
     ``end`` must be earlier than ``date.today()`` because this helper is intended for
-    historical ingestion rather than same-day updates.
+    historical ingestion rather than same-day updates. When ``cache_dir`` is set, parsed
+    PDFs are cached there by content hash so re-seeding unchanged archives skips PDF text
+    extraction.
     """
 
     today = date.today()
@@ -97,6 +176,7 @@ def seed_sbi_historical(
         LOGGER.info("Dry-run enabled; skipping SBI ingestion for %s → %s", start, end)
         return PersistenceResult()
     parser = SBIPDFParser()
+    parse = parser.parse if cache_dir is None else _cached_parser(parser, Path(cache_dir))
     downloader = SBIPDFDownloader()
     resources_root = Path(resource_dir)
     with SQLiteManager(db_path) as manager:
@@ -111,7 +191,7 @@ def seed_sbi_historical(
 
         total = PersistenceResult()
         for pdf_path in pending:
-            parsed = parser.parse(pdf_path)
+            parsed = parse(pdf_path)
             result = manager.insert_rates(parsed.rates)
             LOGGER.info(
                 "Inserted %s SBI rates for %s from %s", result.total, parsed.rate_date, pdf_path
@@ -174,6 +254,7 @@ def main() -> None:
         start=start_date,
         end=end_date,
         download=args.download,
+        cache_dir=args.cache_dir,
     )
 
 
@@ -23,7 +23,10 @@ class _DummyBackend(BackendStrategy):
         *,
         source: str | None = None,
     ) -> list[ForexRateRecord]:
-        return []
+        return [
+            ForexRateRecord(rate_date=date(2024, 1, day), currency="USD", rate=82.0, source="RBI")
+            for day in (1, 2, 3)
+        ]
 
 
 def test_base_backend_lme_methods_raise_not_implemented() -> None:
@@ -33,3 +36,13 @@ def test_base_backend_lme_methods_raise_not_implemented() -> None:
         backend.insert_lme_rates("COPPER", [])
     with pytest.raises(NotImplementedError):
         backend.fetch_lme_range("COPPER")
+
+
+def test_base_backend_fetch_range_iter_validates_batch_size_on_call() -> None:
+    backend = _DummyBackend()
+
+    with pytest.raises(ValueError):
+        backend.fetch_range_iter(batch_size=0)
+
+    batches = list(backend.fetch_range_iter(batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
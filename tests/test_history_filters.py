@@ -51,3 +51,173 @@ def test_rate_sorts_and_blends(sqlite_fx: FxBharat) -> None:
     assert snapshots[0]["source"] == "SBI"
     assert snapshots[1]["source"] == "RBI"
     assert snapshots[0]["rate_date"] <= snapshots[1]["rate_date"]
+
+
+def test_rate_accepts_multiple_sources_in_one_query(
+    sqlite_fx: FxBharat, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_sample_data(sqlite_fx)
+    backend = sqlite_fx._get_backend_strategy()
+    calls: list[str | None] = []
+    original_fetch = backend.fetch_range
+
+    def _tracking_fetch(*args, source=None, **kwargs):
+        calls.append(source)
+        return original_fetch(*args, source=source, **kwargs)
+
+    monkeypatch.setattr(backend, "fetch_range", _tracking_fetch)
+
+    snapshots = sqlite_fx.rate(date(2024, 1, 1), source_filter=("rbi", "sbi"))
+
+    assert calls == [None]
+    assert [snap["source"] for snap in snapshots] == ["SBI", "RBI"]
+    assert snapshots[1]["rates"] == {"USD": 82.0}
+
+
+def test_normalise_source_filter_accepts_sequences() -> None:
+    assert FxBharat._normalise_source_filter(["rbi"]) == ("RBI",)
+    assert FxBharat._normalise_source_filter(("rbi", "SBI")) == ("SBI", "RBI")
+    with pytest.raises(ValueError):
+        FxBharat._normalise_source_filter(())
+
+
+def test_rate_results_are_cached_until_seeding(
+    sqlite_fx: FxBharat, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_sample_data(sqlite_fx)
+    backend = sqlite_fx._get_backend_strategy()
+    calls: list[str | None] = []
+    original_fetch = backend.fetch_latest
+
+    def _tracking_fetch(*, source=None):
+        calls.append(source)
+        return original_fetch(source=source)
+
+    monkeypatch.setattr(backend, "fetch_latest", _tracking_fetch)
+
+    first = sqlite_fx.rate()
+    first[0]["rates"]["USD"]["rate"] = 0.0
+    second = sqlite_fx.rate()
+
+    assert calls == [None]
+    assert second[0]["rates"]["USD"]["rate"] == 81.5
+
+    sqlite_fx.clear_rate_cache()
+    monkeypatch.setattr(FxBharat, "RATE_CACHE_TTL_SECONDS", 0)
+    sqlite_fx.rate()
+    sqlite_fx.rate()
+    assert len(calls) == 3
+
+
+def test_rate_cache_invalidated_by_another_instance(sqlite_fx: FxBharat) -> None:
+    _seed_sample_data(sqlite_fx)
+    assert sqlite_fx.rate(date(2024, 1, 2), source_filter="rbi")[0]["rates"] == {"USD": 82.2}
+
+    writer = FxBharat(db_config=sqlite_fx.connection_info)
+    assert writer.sqlite_manager is not None
+    writer.sqlite_manager.insert_rates(
+        [ForexRateRecord(rate_date=date(2024, 1, 2), currency="EUR", rate=90.1, source="RBI")]
+    )
+    writer.clear_rate_cache()
+
+    snapshot = sqlite_fx.rate(date(2024, 1, 2), source_filter="rbi")[0]
+    assert snapshot["rates"] == {"EUR": 90.1, "USD": 82.2}
+
+
+def test_history_frame_returns_wide_float_columns(sqlite_fx: FxBharat) -> None:
+    _seed_sample_data(sqlite_fx)
+
+    frame = sqlite_fx.history_frame(date(2024, 1, 1), date(2024, 1, 2))
+
+    assert list(frame.index) == [
+        ("SBI", date(2024, 1, 1)),
+        ("RBI", date(2024, 1, 1)),
+        ("RBI", date(2024, 1, 2)),
+    ]
+    assert list(frame.columns) == ["USD"]
+    assert str(frame["USD"].dtype) == "float64"
+    assert frame.loc[("RBI", date(2024, 1, 2)), "USD"] == 82.2
+
+    monthly = sqlite_fx.history_frame(
+        date(2024, 1, 1), date(2024, 1, 2), "monthly", source_filter="rbi"
+    )
+    assert list(monthly.index) == [("RBI", date(2024, 1, 2))]
+
+
+def test_history_frame_handles_empty_ranges(sqlite_fx: FxBharat) -> None:
+    frame = sqlite_fx.history_frame(date(2024, 1, 1), date(2024, 1, 2))
+
+    assert frame.empty
+
+
+def test_iter_history_fetches_sources_lazily(
+    sqlite_fx: FxBharat, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_sample_data(sqlite_fx)
+    backend = sqlite_fx._get_backend_strategy()
+    calls: list[str | None] = []
+    original_fetch = backend.fetch_range
+
+    def _tracking_fetch(*args, source=None, **kwargs):
+        calls.append(source)
+        return original_fetch(*args, source=source, **kwargs)
+
+    monkeypatch.setattr(backend, "fetch_range", _tracking_fetch)
+
+    snapshots = sqlite_fx.iter_history(date(2024, 1, 1), date(2024, 1, 2))
+
+    assert calls == []
+    assert next(snapshots)["source"] == "SBI"
+    assert calls == ["SBI"]
+    assert [snap["source"] for snap in snapshots] == ["RBI", "RBI"]
+    assert calls == ["SBI", "RBI"]
+
+
+def test_iter_history_validates_arguments_eagerly(sqlite_fx: FxBharat) -> None:
+    with pytest.raises(ValueError):
+        sqlite_fx.iter_history(date(2024, 1, 2), date(2024, 1, 1))
+    with pytest.raises(ValueError):
+        sqlite_fx.iter_history(date(2024, 1, 1), date(2024, 1, 2), frequency="hourly")
+
+
+def test_history_orders_currencies_alphabetically(sqlite_fx: FxBharat) -> None:
+    assert sqlite_fx.sqlite_manager is not None
+    sqlite_fx.sqlite_manager.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="EUR", rate=90.0),
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="JPY", rate=0.57),
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="GBP", rate=104.0),
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="EUR", rate=90.5),
+        ]
+    )
+
+    snapshots = sqlite_fx.history(date(2024, 1, 1), date(2024, 1, 2), source_filter="rbi")
+
+    assert [list(snap["rates"]) for snap in snapshots] == [
+        ["EUR", "USD"],
+        ["EUR", "GBP", "JPY"],
+    ]
+
+
+def test_rate_cached_during_seed_is_discarded_afterwards(
+    sqlite_fx: FxBharat, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_sample_data(sqlite_fx)
+    reader = FxBharat(db_config=sqlite_fx.connection_info)
+    assert sqlite_fx.sqlite_manager is not None
+    manager = sqlite_fx.sqlite_manager
+
+    def _fake_rbi(*_args, **_kwargs) -> None:
+        # Another reader caches the half-written state before the seed commits.
+        assert reader.rate(date(2024, 1, 2), source_filter="rbi")[0]["rates"] == {"USD": 82.2}
+        manager.insert_rates(
+            [ForexRateRecord(rate_date=date(2024, 1, 2), currency="EUR", rate=90.1, source="RBI")]
+        )
+
+    monkeypatch.setattr("fx_bharat.seeds.populate_rbi_forex.seed_rbi_forex", _fake_rbi)
+
+    sqlite_fx.seed(from_date=date(2024, 1, 1), to_date=date(2024, 1, 2), source="RBI")
+
+    snapshot = reader.rate(date(2024, 1, 2), source_filter="rbi")[0]
+    assert snapshot["rates"] == {"EUR": 90.1, "USD": 82.2}
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import date
+import threading
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -23,18 +24,24 @@ class _DummyCursor:
 
 class _DummyCollection:
     def __init__(self, name: str = "") -> None:
-        self.docs: Dict[tuple[str, str] | str, Dict[str, Any]] = {}
+        self.docs: Dict[tuple[datetime, str] | datetime, Dict[str, Any]] = {}
         self.indexes: list[tuple[tuple[tuple[str, int], ...], bool]] = []
+        self.bulk_sizes: list[int] = []
+        self.inserted_batches = 0
         self.name = name
 
     def __bool__(self) -> bool:  # pragma: no cover - behavioural parity with pymongo
         raise NotImplementedError("Collection truthiness is undefined")
 
-    def create_index(self, fields: list[tuple[str, int]], unique: bool) -> None:
+    def create_index(
+        self, fields: list[tuple[str, int]], unique: bool, background: bool = False
+    ) -> None:
         self.indexes.append((tuple(fields), unique))
+        self.background = background
 
     def bulk_write(self, operations: list["_DummyUpdateOne"], ordered: bool) -> "_DummyBulkResult":
         assert ordered is False
+        self.bulk_sizes.append(len(operations))
         for op in operations:
             assert isinstance(op, _DummyUpdateOne)
             if "currency_code" in op.filter:
@@ -44,16 +51,37 @@ class _DummyCollection:
             self.docs[key] = dict(op.update["$set"])
         return _DummyBulkResult()
 
-    def find(self, query: Dict[str, Dict[str, str]]):  # type: ignore[override]
+    def insert_many(self, documents: list[Dict[str, Any]], ordered: bool) -> None:
+        assert ordered is False
+        self.inserted_batches += 1
+        for doc in documents:
+            key = (doc["rate_date"], doc["currency_code"])
+            if key in self.docs:
+                raise RuntimeError("duplicate key")
+            self.docs[key] = dict(doc)
+
+    def find(self, query: Dict[str, Any], projection: Dict[str, int] | None = None):
         docs = list(self.docs.values())
+        if projection is not None:
+            docs = [{key: doc[key] for key in doc if projection.get(key)} for doc in docs]
         if "rate_date" in query:
             range_query = query["rate_date"]
+            if isinstance(range_query, datetime):
+                return _DummyCursor([doc for doc in docs if doc["rate_date"] == range_query])
             if "$gte" in range_query:
                 docs = [doc for doc in docs if doc["rate_date"] >= range_query["$gte"]]
             if "$lte" in range_query:
                 docs = [doc for doc in docs if doc["rate_date"] <= range_query["$lte"]]
         return _DummyCursor(docs)
 
+    def find_one(
+        self, query: Dict[str, Any], projection: Dict[str, int], *, sort: list[tuple[str, int]]
+    ) -> Dict[str, Any] | None:
+        assert query == {}
+        ((field, direction),) = sort
+        docs = self.find(query).sort(field, direction)
+        return {key: docs[0][key] for key in projection} if docs else None
+
 
 class _DummyBulkResult:
     inserted_count = 0
@@ -63,7 +91,7 @@ class _DummyBulkResult:
 
 class _DummyUpdateOne:
     def __init__(
-        self, filter: Dict[str, str], update: Dict[str, Dict[str, Any]], *, upsert: bool
+        self, filter: Dict[str, Any], update: Dict[str, Dict[str, Any]], *, upsert: bool
     ) -> None:
         assert upsert is True
         self.filter = filter
@@ -108,6 +136,8 @@ def patch_mongo_client(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_mongo_backend_roundtrip(tmp_path: Path) -> None:
     backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
     backend.ensure_schema()
+    assert backend._rbi_collection.indexes == [((("rate_date", 1), ("currency_code", 1)), True)]
+    assert backend._rbi_collection.background is True
 
     rows = [
         ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.5),
@@ -155,13 +185,11 @@ def test_mongo_backend_handles_empty_inputs() -> None:
     backend.close()
 
 
-def test_mongo_backend_fetch_range_uses_collection_name() -> None:
+def test_mongo_backend_fetch_range_labels_rows_by_source_collection() -> None:
     backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
-    backend._collection = _DummyCollection(name="forex_rates_sbi")
-    backend._sbi_collection = None
-    backend._rbi_collection = None
-    backend._collection.docs[("2024-01-01", "USD")] = {
-        "rate_date": "2024-01-01",
+    backend._sbi_collection = _DummyCollection(name="forex_rates_sbi")
+    backend._sbi_collection.docs[(datetime(2024, 1, 1), "USD")] = {
+        "rate_date": datetime(2024, 1, 1),
         "currency_code": "USD",
         "rate": 82.5,
     }
@@ -171,11 +199,34 @@ def test_mongo_backend_fetch_range_uses_collection_name() -> None:
     backend.close()
 
 
+def test_mongo_backend_fetch_latest_reads_newest_date_per_source() -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    assert backend.fetch_latest() == []
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="USD", rate=83.0),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="EUR", rate=90.0),
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=81.0, source="SBI"),
+        ]
+    )
+
+    latest = backend.fetch_latest()
+
+    assert sorted((row.source, row.rate_date, row.currency) for row in latest) == [
+        ("RBI", date(2024, 1, 3), "EUR"),
+        ("RBI", date(2024, 1, 3), "USD"),
+        ("SBI", date(2024, 1, 1), "USD"),
+    ]
+    assert {row.source for row in backend.fetch_latest(source="SBI")} == {"SBI"}
+    backend.close()
+
+
 def test_mongo_backend_fetch_lme_range_with_dates() -> None:
     backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
     backend._lme_copper_collection = _DummyCollection(name="lme_copper_rates")
-    backend._lme_copper_collection.docs["2024-01-01"] = {
-        "rate_date": "2024-01-01",
+    backend._lme_copper_collection.docs[datetime(2024, 1, 1)] = {
+        "rate_date": datetime(2024, 1, 1),
         "price": 8500.0,
         "price_3_month": 8450.0,
         "stock": 100,
@@ -183,3 +234,96 @@ def test_mongo_backend_fetch_lme_range_with_dates() -> None:
     rows = backend.fetch_lme_range("COPPER", start=date(2024, 1, 1), end=date(2024, 1, 1))
     assert rows[0].price == 8500.0
     backend.close()
+
+
+def test_mongo_backend_stores_rate_dates_as_bson_dates() -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    backend.insert_rates([ForexRateRecord(rate_date=date(2024, 3, 4), currency="USD", rate=83.0)])
+
+    (doc,) = backend._rbi_collection.docs.values()
+    assert doc["rate_date"] == datetime(2024, 3, 4)
+    assert backend.fetch_range(date(2024, 3, 4), date(2024, 3, 4))[0].rate_date == date(2024, 3, 4)
+    backend.close()
+
+
+def test_mongo_backend_splits_large_inserts_into_bulk_batches() -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    backend.default_chunk_size = 2
+    rows = [
+        ForexRateRecord(rate_date=date(2024, 1, day), currency="USD", rate=82.0 + day)
+        for day in range(1, 6)
+    ]
+
+    assert backend.insert_rates(rows).inserted == 5
+    assert backend._rbi_collection.bulk_sizes == [2, 2, 1]
+    assert len(backend.fetch_range()) == 5
+    backend.close()
+
+
+def test_mongo_backend_cold_load_uses_insert_many() -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    rows = [ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.5)]
+
+    assert backend.insert_rates(rows, upsert=False).inserted == 1
+    assert backend._rbi_collection.bulk_sizes == []
+    assert backend._rbi_collection.inserted_batches == 1
+    assert backend.fetch_range()[0].rate == 82.5
+    backend.close()
+
+
+def test_mongo_backend_fetch_range_iter_streams_batches() -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, day), currency="USD", rate=80.0 + day)
+            for day in range(1, 6)
+        ]
+    )
+
+    batches = list(backend.fetch_range_iter(source="RBI", batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row.rate_date.day for batch in batches for row in batch] == [1, 2, 3, 4, 5]
+    with pytest.raises(ValueError):
+        backend.fetch_range_iter(batch_size=0)
+    backend.close()
+
+
+def test_mongo_backend_queries_both_sources_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=83.0, source="SBI"),
+        ]
+    )
+    query_threads: list[threading.Thread] = []
+    original_find = _DummyCollection.find
+
+    def _recording_find(self, query, projection=None):
+        query_threads.append(threading.current_thread())
+        return original_find(self, query, projection)
+
+    monkeypatch.setattr(_DummyCollection, "find", _recording_find)
+
+    rows = backend.fetch_range()
+
+    assert [row.source for row in rows] == ["SBI", "RBI"]
+    assert len(query_threads) == 2
+    assert threading.main_thread() not in query_threads
+    backend.close()
+
+
+def test_mongo_backend_routes_rows_by_source_case_insensitively() -> None:
+    backend = mongo_module.MongoBackend("mongodb://example.com/", database="fx")
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.0, source="SBI"),
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=83.0, source="sbi"),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="USD", rate=84.0, source=""),
+        ]
+    )
+
+    assert len(backend._sbi_collection.docs) == 2
+    assert len(backend._rbi_collection.docs) == 1
+    backend.close()
@@ -3,6 +3,9 @@
 from datetime import date, datetime
 from pathlib import Path
 
+import pytest
+
+from fx_bharat.db import relational_backend
 from fx_bharat.db.relational_backend import RelationalBackend, _normalise_rate_date
 from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
 
@@ -61,3 +64,157 @@ def test_relational_backend_lme_roundtrip(tmp_path: Path) -> None:
     assert fetched[0].metal == "COPPER"
 
     backend.close()
+
+
+def test_relational_backend_fetch_period_end_range(tmp_path: Path) -> None:
+    backend = RelationalBackend(f"sqlite:///{tmp_path / 'period.db'}")
+    backend.ensure_schema()
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 30), currency="USD", rate=83.0),
+            ForexRateRecord(rate_date=date(2024, 1, 30), currency="EUR", rate=90.0),
+            ForexRateRecord(rate_date=date(2024, 2, 5), currency="USD", rate=84.0),
+        ]
+    )
+
+    monthly = backend.fetch_period_end_range(
+        date(2024, 1, 1), date(2024, 2, 28), source="RBI", frequency="monthly"
+    )
+    yearly = backend.fetch_period_end_range(source="RBI", frequency="yearly")
+
+    assert sorted((row.rate_date, row.currency) for row in monthly) == [
+        (date(2024, 1, 30), "EUR"),
+        (date(2024, 1, 30), "USD"),
+        (date(2024, 2, 5), "USD"),
+    ]
+    assert {row.rate_date for row in yearly} == {date(2024, 2, 5)}
+    backend.close()
+
+
+def test_relational_backend_fetch_latest(tmp_path: Path) -> None:
+    backend = RelationalBackend(f"sqlite:///{tmp_path / 'latest.db'}")
+    backend.ensure_schema()
+    assert backend.fetch_latest() == []
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="USD", rate=83.0),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="EUR", rate=90.0),
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=81.0, source="SBI"),
+        ]
+    )
+
+    latest = backend.fetch_latest()
+
+    assert sorted((row.source, row.rate_date, row.currency) for row in latest) == [
+        ("RBI", date(2024, 1, 3), "EUR"),
+        ("RBI", date(2024, 1, 3), "USD"),
+        ("SBI", date(2024, 1, 1), "USD"),
+    ]
+    assert {row.source for row in backend.fetch_latest(source="RBI")} == {"RBI"}
+    backend.close()
+
+
+def test_relational_backend_refresh_statistics(tmp_path: Path) -> None:
+    backend = RelationalBackend(f"sqlite:///{tmp_path / 'analyze.db'}")
+    backend.ensure_schema()
+    backend.insert_rates([ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0)])
+
+    backend.refresh_statistics()
+
+    with backend._get_engine().connect() as connection:
+        analyzed = {
+            row[0] for row in connection.exec_driver_sql("SELECT tbl FROM sqlite_stat1").fetchall()
+        }
+    assert "forex_rates_rbi" in analyzed
+    backend.close()
+
+
+def test_relational_backend_tunes_pool_for_server_urls(monkeypatch) -> None:
+    calls: list[tuple[str, dict[str, object]]] = []
+
+    def _fake_create_engine(url: str, **kwargs: object) -> object:
+        calls.append((url, kwargs))
+        return object()
+
+    monkeypatch.setattr(relational_backend, "create_engine", _fake_create_engine)
+
+    RelationalBackend("postgresql://user:pw@localhost/fx")._get_engine()
+    RelationalBackend("sqlite:///:memory:")._get_engine()
+
+    server_kwargs = calls[0][1]
+    assert server_kwargs["pool_pre_ping"] is True
+    assert server_kwargs["pool_use_lifo"] is True
+    assert server_kwargs["pool_recycle"] == 1800
+    assert calls[1][1] == {"future": True}
+
+
+def test_relational_backend_fetch_range_iter_streams_batches(tmp_path: Path) -> None:
+    backend = RelationalBackend(f"sqlite:///{tmp_path / 'stream.db'}")
+    backend.ensure_schema()
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, day), currency="USD", rate=82.0 + day)
+            for day in range(1, 6)
+        ]
+        + [ForexRateRecord(rate_date=date(2024, 1, 1), currency="EUR", rate=90.0, source="SBI")]
+    )
+
+    batches = list(backend.fetch_range_iter(batch_size=2))
+
+    assert [len(batch) for batch in batches] == [1, 2, 2, 1]
+    assert [row.source for row in batches[0]] == ["SBI"]
+    assert [row.rate for batch in batches[1:] for row in batch] == [83.0, 84.0, 85.0, 86.0, 87.0]
+    with pytest.raises(ValueError):
+        backend.fetch_range_iter(batch_size=0)
+    backend.close()
+
+
+def test_relational_backend_fetch_range_returns_float_rates(tmp_path: Path) -> None:
+    backend = RelationalBackend(f"sqlite:///{tmp_path / 'floats.db'}")
+    backend.ensure_schema()
+    backend.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82),
+            ForexRateRecord(
+                rate_date=date(2024, 1, 1), currency="USD", rate=83, source="SBI", tt_buy=84
+            ),
+        ]
+    )
+
+    sbi, rbi = backend.fetch_range()
+
+    assert type(rbi.rate) is float and rbi.rate == 82.0
+    assert type(sbi.rate) is float and type(sbi.tt_buy) is float
+    assert sbi.tt_sell is None
+    backend.close()
+
+
+def test_mysql_bulk_upsert_caps_rows_per_statement(monkeypatch) -> None:
+    executed: list[int] = []
+
+    class _Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc) -> None:
+            return None
+
+        def executemany(self, _sql, values) -> None:
+            executed.append(len(values))
+
+    class _Connection:
+        connection = type("_Raw", (), {"cursor": lambda self: _Cursor()})()
+
+    monkeypatch.setitem(relational_backend.BULK_STATEMENT_ROWS, "mysql", 2)
+    values = [(date(2024, 1, day), 8000.0, None, None, None) for day in range(1, 6)]
+
+    assert relational_backend._mysql_bulk_upsert(
+        _Connection(),
+        "lme_copper_rates",
+        relational_backend.LME_COLUMNS,
+        relational_backend.LME_UPDATES,
+        values,
+    )
+    assert executed == [2, 2, 1]
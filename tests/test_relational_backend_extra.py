@@ -4,6 +4,7 @@ from datetime import date
 from pathlib import Path
 
 import pytest
+from sqlalchemy import event
 
 from fx_bharat.db.relational_backend import RelationalBackend
 from fx_bharat.ingestion.models import ForexRateRecord, LmeRateRecord
@@ -26,6 +27,59 @@ def test_relational_backend_filters_by_source(tmp_path: Path) -> None:
         backend.close()
 
 
+def test_relational_backend_routes_rows_by_source_case_insensitively(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'relational_routing.db'}"
+    backend = RelationalBackend(db_url)
+    backend.ensure_schema()
+    try:
+        rows = [
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.5, source="sbi"),
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="EUR", rate=90.1, source=None),
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="GBP", rate=104.2, source="rbi"),
+        ]
+        backend.insert_rates(rows)
+        assert [row.currency for row in backend.fetch_range(source="SBI")] == ["USD"]
+        assert sorted(row.currency for row in backend.fetch_range(source="RBI")) == [
+            "EUR",
+            "GBP",
+        ]
+    finally:
+        backend.close()
+
+
+def test_relational_backend_batches_replace_for_dialects_without_upsert(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'relational_generic.db'}"
+    backend = RelationalBackend(db_url)
+    backend.ensure_schema()
+    backend._dialect_name = "generic"
+    statements: list[str] = []
+
+    @event.listens_for(backend._get_engine(), "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement.split()[0])
+
+    try:
+        backend.insert_rates(
+            [ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.0)]
+        )
+        statements.clear()
+        backend.insert_rates(
+            [
+                ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.5),
+                ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=83.0),
+                ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=83.5),
+            ]
+        )
+        assert statements == ["DELETE", "INSERT"]
+        fetched = backend.fetch_range(source="RBI")
+        assert [(row.rate_date, row.rate) for row in fetched] == [
+            (date(2024, 1, 1), 82.5),
+            (date(2024, 1, 2), 83.5),
+        ]
+    finally:
+        backend.close()
+
+
 def test_relational_backend_lme_filters_and_invalid_metal(tmp_path: Path) -> None:
     db_url = f"sqlite:///{tmp_path / 'relational_lme.db'}"
     backend = RelationalBackend(db_url)
@@ -37,13 +37,14 @@ class _DummyConnection:
         if "SELECT DATABASE()" in sql:
             return _DummyResult(scalar_value="testdb")
         if "information_schema.columns" in sql:
-            return _DummyResult(rows=[(col,) for col in self.existing])
+            tables = [value for key, value in params.items() if key != "schema"]
+            return _DummyResult(rows=[(table, col) for table in tables for col in self.existing])
         return _DummyResult()
 
 
 def test_relational_backend_schema_patch_postgres() -> None:
     backend = RelationalBackend("sqlite:///:memory:")
-    connection = _DummyConnection("postgresql", {"rate_date", "usd_price"})
+    connection = _DummyConnection("postgresql", {"rate_date", "usd_price", "eur_price"})
 
     backend._ensure_lme_schema(connection)
 
@@ -51,9 +52,12 @@ def test_relational_backend_schema_patch_postgres() -> None:
         "ALTER TABLE lme_copper_rates ADD COLUMN price" in sql for sql in connection.executed
     )
     assert any(
-        "ALTER TABLE lme_copper_rates DROP COLUMN IF EXISTS usd_price" in sql
+        "ALTER TABLE lme_copper_rates DROP COLUMN IF EXISTS usd_price, "
+        "DROP COLUMN IF EXISTS eur_price" in sql
         for sql in connection.executed
     )
+    assert sum("information_schema.columns" in sql for sql in connection.executed) == 1
+    assert len(connection.executed) == 5
 
 
 def test_relational_backend_schema_patch_mysql() -> None:
@@ -63,8 +67,23 @@ def test_relational_backend_schema_patch_mysql() -> None:
     backend._ensure_lme_schema(connection)
 
     assert any(
-        "ALTER TABLE lme_aluminum_rates ADD COLUMN price" in sql for sql in connection.executed
+        "ALTER TABLE lme_aluminum_rates ADD COLUMN price NUMERIC(18, 6), "
+        "ADD COLUMN price_3_month" in sql
+        for sql in connection.executed
     )
     assert any(
         "ALTER TABLE lme_aluminum_rates DROP COLUMN usd_price" in sql for sql in connection.executed
     )
+
+
+def test_relational_backend_range_indexes_postgres_only() -> None:
+    backend = RelationalBackend("sqlite:///:memory:")
+    postgres = _DummyConnection("postgresql", set())
+    mysql = _DummyConnection("mysql", set())
+
+    backend._ensure_range_indexes(postgres)
+    backend._ensure_range_indexes(mysql)
+
+    assert any("USING BRIN (rate_date)" in sql for sql in postgres.executed)
+    assert len(postgres.executed) == 2
+    assert mysql.executed == []
@@ -25,6 +25,19 @@ def test_sbi_pdf_infer_date_from_filename() -> None:
     assert parsed == date(2024, 4, 5)
 
 
+def test_sbi_pdf_parse_reports_document_date(tmp_path: Path) -> None:
+    parser = SBIPDFParser()
+    dated = tmp_path / "2024-05-06.pdf"
+    dated.write_text("DATE: 01/02/2024", encoding="utf-8")
+    undated = tmp_path / "2024-05-07.pdf"
+    undated.write_text("no date", encoding="utf-8")
+
+    assert parser.parse(dated).document_date == date(2024, 2, 1)
+    parsed = parser.parse(undated)
+    assert parsed.document_date is None
+    assert parsed.rate_date == date(2024, 5, 7)
+
+
 def test_sbi_pdf_infer_date_fallback_to_utc(monkeypatch) -> None:
     class _DummyDateTime(datetime):
         @classmethod
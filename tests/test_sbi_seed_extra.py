@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from fx_bharat.ingestion.models import ForexRateRecord
-from fx_bharat.ingestion.sbi_pdf import SBIPDFParseResult
+from fx_bharat.ingestion.sbi_pdf import SBI_PDF_PARSER_VERSION, SBIPDFParseResult
 from fx_bharat.seeds import populate_sbi_forex as sbi_module
 
 
@@ -121,6 +121,161 @@ def test_seed_sbi_historical_downloads_latest(tmp_path: Path, monkeypatch) -> No
     assert result.total == 1
 
 
+def test_seed_sbi_historical_inserts_in_date_order(tmp_path: Path, monkeypatch) -> None:
+    pdf_paths = []
+    for day in range(1, 6):
+        path = tmp_path / f"2024-01-0{day}.pdf"
+        path.write_bytes(b"dummy")
+        pdf_paths.append(path)
+
+    class _DummyParser:
+        def parse(self, path: str | Path):  # type: ignore[override]
+            rate_date = date.fromisoformat(Path(path).stem)
+            return SBIPDFParseResult(
+                rate_date=rate_date,
+                rates=[ForexRateRecord(rate_date=rate_date, currency="USD", rate=82.5)],
+            )
+
+    checkpoints: list[date] = []
+
+    class _DummyManager:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def ingestion_checkpoint(self, _source: str):
+            return None
+
+        def latest_rate_date(self, _source: str):
+            return None
+
+        def insert_rates(self, _rows):
+            return sbi_module.PersistenceResult(inserted=1)
+
+        def update_ingestion_checkpoint(self, _source: str, rate_date: date) -> None:
+            checkpoints.append(rate_date)
+
+    monkeypatch.setattr(sbi_module, "SBIPDFParser", _DummyParser)
+    monkeypatch.setattr(sbi_module, "SBIPDFDownloader", lambda: object())
+    monkeypatch.setattr(sbi_module, "SQLiteManager", lambda *_args, **_kwargs: _DummyManager())
+
+    result = sbi_module.seed_sbi_historical(
+        db_path=tmp_path / "sbi.db",
+        resource_dir=tmp_path,
+        download=False,
+    )
+
+    assert result.inserted == 5
+    assert checkpoints == [date.fromisoformat(path.stem) for path in pdf_paths]
+
+
+def test_seed_sbi_historical_reuses_cached_parse(tmp_path: Path, monkeypatch) -> None:
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "2024-01-02.pdf").write_bytes(b"dummy")
+    parse_calls: list[Path] = []
+    inserted: list[list[ForexRateRecord]] = []
+
+    class _DummyParser:
+        def parse(self, path: str | Path):  # type: ignore[override]
+            parse_calls.append(Path(path))
+            return SBIPDFParseResult(
+                rate_date=date(2024, 1, 2),
+                rates=[
+                    ForexRateRecord(
+                        rate_date=date(2024, 1, 2),
+                        currency="USD",
+                        rate=82.5,
+                        source="SBI",
+                        tt_buy=82.5,
+                        cn_sell=84.0,
+                    )
+                ],
+            )
+
+    class _DummyManager:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def insert_rates(self, rows):
+            inserted.append(list(rows))
+            return sbi_module.PersistenceResult(inserted=len(rows))
+
+        def update_ingestion_checkpoint(self, *_args, **_kwargs):
+            return None
+
+    monkeypatch.setattr(sbi_module, "SBIPDFParser", _DummyParser)
+    monkeypatch.setattr(sbi_module, "SBIPDFDownloader", lambda: object())
+    monkeypatch.setattr(sbi_module, "SQLiteManager", lambda *_args, **_kwargs: _DummyManager())
+
+    for _ in range(2):
+        sbi_module.seed_sbi_historical(
+            resource_dir=resource_dir,
+            start=date(2024, 1, 1),
+            download=False,
+            cache_dir=tmp_path / "cache",
+        )
+
+    assert len(parse_calls) == 1
+    assert inserted[0] == inserted[1]
+
+
+def test_seed_sbi_historical_cache_dates_identical_pdfs_by_path(
+    tmp_path: Path, monkeypatch
+) -> None:
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    for name in ("2024-01-01.pdf", "2024-01-02.pdf"):
+        (resource_dir / name).write_bytes(b"same bytes")
+    parse_calls: list[Path] = []
+    inserted: list[list[ForexRateRecord]] = []
+
+    class _DummyParser:
+        def parse(self, path: str | Path):  # type: ignore[override]
+            parse_calls.append(Path(path))
+            rate_date = date.fromisoformat(Path(path).stem)
+            return SBIPDFParseResult(
+                rate_date=rate_date,
+                rates=[ForexRateRecord(rate_date=rate_date, currency="USD", rate=82.5)],
+            )
+
+    class _DummyManager:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def insert_rates(self, rows):
+            inserted.append(list(rows))
+            return sbi_module.PersistenceResult(inserted=len(rows))
+
+        def update_ingestion_checkpoint(self, *_args, **_kwargs):
+            return None
+
+    monkeypatch.setattr(sbi_module, "SBIPDFParser", _DummyParser)
+    monkeypatch.setattr(sbi_module, "SBIPDFDownloader", lambda: object())
+    monkeypatch.setattr(sbi_module, "SQLiteManager", lambda *_args, **_kwargs: _DummyManager())
+
+    sbi_module.seed_sbi_historical(
+        resource_dir=resource_dir,
+        start=date(2024, 1, 1),
+        download=False,
+        cache_dir=tmp_path / "cache",
+    )
+
+    assert len(parse_calls) == 1
+    assert [rows[0].rate_date for rows in inserted] == [date(2024, 1, 1), date(2024, 1, 2)]
+    cache_files = [path.name for path in (tmp_path / "cache").iterdir()]
+    assert len(cache_files) == 1
+    assert f".p{SBI_PDF_PARSER_VERSION}." in cache_files[0]
+
+
 def test_seed_sbi_today_persists_pdf(tmp_path: Path, monkeypatch) -> None:
     pdf_path = tmp_path / "latest.pdf"
     pdf_path.write_bytes(b"dummy")
@@ -164,6 +319,7 @@ def test_seed_sbi_main_invokes_historical(monkeypatch) -> None:
         start = "2024-01-01"
         end = "2024-01-31"
         download = False
+        cache_dir = None
 
     called = {"value": False}
 
@@ -55,6 +55,24 @@ class SQLiteManagerTests(unittest.TestCase):
         self.assertEqual(len(feb_rows), 1)
         self.assertEqual(feb_rows[0].rate_date, date(2024, 2, 1))
 
+    def test_fetch_range_single_day_reuses_statement(self) -> None:
+        rows = [
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=82.6),
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.9),
+        ]
+        self.manager.insert_rates(rows)
+        backend = self.manager._backend
+        statement_cache = type(backend)._range_statement
+        statement_cache.cache_clear()
+
+        first = self.manager.fetch_range(date(2024, 1, 1), date(2024, 1, 1), source="RBI")
+        second = self.manager.fetch_range(date(2024, 1, 2), date(2024, 1, 2), source="RBI")
+
+        self.assertEqual([row.rate for row in first], [82.6])
+        self.assertEqual([row.rate for row in second], [82.9])
+        self.assertEqual(statement_cache.cache_info().misses, 1)
+        self.assertEqual(statement_cache.cache_info().hits, 1)
+
     def test_ingestion_metadata_tracks_latest_date(self) -> None:
         self.assertIsNone(self.manager.ingestion_checkpoint("RBI"))
 
@@ -64,3 +64,111 @@ def test_sqlite_fallback_updates_and_filters(
     assert filtered[0].tt_sell == 2.0
 
     manager.close()
+
+
+@pytest.mark.parametrize("use_sqlalchemy", [True, False])
+def test_sqlite_manager_fetch_period_end_range(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_sqlalchemy: bool
+) -> None:
+    monkeypatch.setattr(sqlite_manager_module, "SQLALCHEMY_AVAILABLE", use_sqlalchemy)
+    manager = sqlite_manager_module.SQLiteManager(tmp_path / "period.db")
+    manager.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 30), currency="USD", rate=83.0),
+            ForexRateRecord(rate_date=date(2024, 2, 5), currency="USD", rate=84.0),
+            ForexRateRecord(rate_date=date(2024, 2, 6), currency="USD", rate=85.0, source="SBI"),
+        ]
+    )
+
+    monthly = manager.fetch_period_end_range(
+        date(2024, 1, 1), date(2024, 2, 5), source="RBI", frequency="monthly"
+    )
+    yearly = manager.fetch_period_end_range(frequency="yearly")
+
+    assert [row.rate for row in monthly] == [83.0, 84.0]
+    assert {(row.source, row.rate_date) for row in yearly} == {
+        ("SBI", date(2024, 2, 6)),
+        ("RBI", date(2024, 2, 5)),
+    }
+    with pytest.raises(ValueError):
+        manager.fetch_period_end_range(frequency="weekly")
+    manager.close()
+
+
+@pytest.mark.parametrize("use_sqlalchemy", [True, False])
+def test_sqlite_manager_fetch_latest(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_sqlalchemy: bool
+) -> None:
+    monkeypatch.setattr(sqlite_manager_module, "SQLALCHEMY_AVAILABLE", use_sqlalchemy)
+    manager = sqlite_manager_module.SQLiteManager(tmp_path / "latest.db")
+    assert manager.fetch_latest() == []
+    manager.insert_rates(
+        [
+            ForexRateRecord(rate_date=date(2024, 1, 2), currency="USD", rate=82.0),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="USD", rate=83.0),
+            ForexRateRecord(rate_date=date(2024, 1, 3), currency="EUR", rate=90.0),
+            ForexRateRecord(rate_date=date(2024, 1, 1), currency="USD", rate=81.0, source="SBI"),
+        ]
+    )
+
+    latest = manager.fetch_latest()
+
+    assert sorted((row.source, row.rate_date, row.currency) for row in latest) == [
+        ("RBI", date(2024, 1, 3), "EUR"),
+        ("RBI", date(2024, 1, 3), "USD"),
+        ("SBI", date(2024, 1, 1), "USD"),
+    ]
+    assert {row.source for row in manager.fetch_latest(source="SBI")} == {"SBI"}
+    manager.close()
+
+
+@pytest.mark.parametrize("use_sqlalchemy", [True, False])
+def test_sqlite_manager_fetch_range_iter_yields_bounded_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_sqlalchemy: bool
+) -> None:
+    monkeypatch.setattr(sqlite_manager_module, "SQLALCHEMY_AVAILABLE", use_sqlalchemy)
+    manager = sqlite_manager_module.SQLiteManager(tmp_path / "stream.db")
+    manager.insert_rates(
+        [
+            *(
+                ForexRateRecord(rate_date=date(2024, 1, day), currency="USD", rate=80.0 + day)
+                for day in range(1, 6)
+            ),
+            ForexRateRecord(
+                rate_date=date(2024, 1, 3), currency="EUR", rate=90.0, source="SBI", tt_buy=1.5
+            ),
+        ]
+    )
+
+    batches = list(manager.fetch_range_iter(date(2024, 1, 2), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [1, 2, 2]
+    assert batches[0][0].source == "SBI"
+    assert batches[0][0].tt_buy == 1.5
+    assert [row.rate_date.day for batch in batches[1:] for row in batch] == [2, 3, 4, 5]
+    assert [row for batch in batches for row in batch] == manager.fetch_range(date(2024, 1, 2))
+    with pytest.raises(ValueError, match="batch_size"):
+        manager.fetch_range_iter(batch_size=0)
+    manager.close()
+
+
+@pytest.mark.parametrize("use_sqlalchemy", [True, False])
+def test_sqlite_manager_applies_connection_pragmas(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_sqlalchemy: bool
+) -> None:
+    monkeypatch.setattr(sqlite_manager_module, "SQLALCHEMY_AVAILABLE", use_sqlalchemy)
+    manager = sqlite_manager_module.SQLiteManager(tmp_path / "pragmas.db")
+    backend = manager._backend
+
+    if use_sqlalchemy:
+        with backend.engine.connect() as connection:
+            cache_size = connection.exec_driver_sql("PRAGMA cache_size").scalar()
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    else:
+        cache_size = backend._connection.execute("PRAGMA cache_size").fetchone()[0]
+        journal_mode = backend._connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert cache_size == -65536
+    assert journal_mode == "delete"
+    manager.close()